@@ -1,21 +1,235 @@
+import os
+import sys
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import Dict, List, Tuple
 from scipy import stats
 import json
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
 
-class NumberAnalyzer:
+# Sample arrays stay float64: in float32, LLM-favoured values such as 0.3 and
+# 0.9 land in a different chi-square bin and min/max would be reported as
+# e.g. 0.699999988 instead of 0.7, for no measurable gain at these sizes
+SAMPLE_DTYPE = np.float64
+
+_PYPLOT = None
+
+
+def _pyplot():
     """
-    A class to analyze the distribution and consistency of generated numbers.
+    Import pyplot on first use and apply the plotting style once per process.
+
+    matplotlib and seaborn are only loaded when a visualization is created,
+    so analysis-only runs never pay for them.
+
+    Returns:
+        module: matplotlib.pyplot
     """
+    global _PYPLOT
+    if _PYPLOT is None:
+        import matplotlib
+
+        # Use the non-interactive backend on headless machines, unless one
+        # was chosen
+        if (
+            sys.platform.startswith("linux")
+            and not os.environ.get("DISPLAY")
+            and not os.environ.get("WAYLAND_DISPLAY")
+            and "MPLBACKEND" not in os.environ
+        ):
+            matplotlib.use("Agg")
+
+        import matplotlib.pyplot as plt
+        import seaborn as sns
 
-    def __init__(self):
-        """Initialize the analyzer with plotting style."""
         plt.style.use("seaborn-v0_8")
         sns.set_palette("husl")
+        _PYPLOT = plt
+
+    return _PYPLOT
+
+
+def _uniform_bin_counts(
+    values: np.ndarray, lo: float, hi: float, bins: int
+) -> np.ndarray:
+    """
+    Count values into equal-width bins over [lo, hi], like np.histogram.
+
+    Equal-width bins let the bin index be computed with a multiply and a
+    bincount instead of a search over the edges.
+
+    Args:
+        values (np.ndarray): Values to bin
+        lo (float): Left edge of the first bin
+        hi (float): Right edge of the last bin (inclusive)
+        bins (int): Number of bins
+
+    Returns:
+        np.ndarray: Count per bin
+    """
+    inside = (values >= lo) & (values <= hi)
+    if not inside.all():
+        values = values[inside]
+
+    edges = np.linspace(lo, hi, bins + 1)
+    idx = ((values - lo) * (bins / (hi - lo))).astype(np.intp)
+    np.clip(idx, 0, bins - 1, out=idx)
+
+    # Move values that rounding put on the wrong side of an edge,
+    # so boundary values land in the same bin np.histogram would use
+    idx -= values < edges[idx]
+    idx += (values >= edges[idx + 1]) & (idx != bins - 1)
+
+    return np.bincount(idx, minlength=bins)
+
+
+def _range_stats(
+    numbers: np.ndarray, min_val: float, max_val: float
+) -> Tuple[int, float, float, float, float, float]:
+    """
+    Compute the descriptive statistics of one range's samples.
+
+    Each reduction runs once over the array and the std reuses the mean.
+
+    Args:
+        numbers (np.ndarray): Non-empty array of numbers
+        min_val (float): Minimum value of the range
+        max_val (float): Maximum value of the range
+
+    Returns:
+        Tuple[int, float, float, float, float, float]: Sample count, mean,
+        std (ddof=0), min, max and the fraction of the range covered
+    """
+    n = numbers.size
+    mean = numbers.sum() / n
+    deviations = numbers - mean
+    std = np.sqrt(np.dot(deviations, deviations) / n)
+    lo = numbers.min()
+    hi = numbers.max()
+    coverage = (hi - lo) / (max_val - min_val)
+
+    return n, float(mean), float(std), float(lo), float(hi), float(coverage)
+
+
+def _uniformity_kernel(
+    numbers: np.ndarray, min_val: float, max_val: float
+) -> Tuple[float, np.ndarray, int]:
+    """
+    Compute the KS statistic and chi-square bin counts against a uniform.
+
+    The sample is normalized and sorted once into a single work array. The
+    KS scan reads it directly and the 10-bin counts are binary searches
+    into it.
+
+    Args:
+        numbers (np.ndarray): Array of numbers
+        min_val (float): Minimum value of the range
+        max_val (float): Maximum value of the range
+
+    Returns:
+        Tuple[float, np.ndarray, int]: KS statistic, observed count per bin
+        and sample size
+    """
+    # Normalize numbers to [0, 1] range
+    normalized = np.subtract(numbers, min_val, dtype=np.float64)
+    normalized /= max_val - min_val
+    normalized.sort()
+    n = normalized.size
+
+    # The uniform CDF on [0, 1] is the identity, so the KS statistic is the
+    # largest gap between the sorted sample and the empirical CDF steps
+    cdf_values = np.clip(normalized, 0.0, 1.0)
+    steps = np.arange(1.0, n + 1) / n
+    d_plus = (steps - cdf_values).max()
+    d_minus = (cdf_values - (steps - 1.0 / n)).max()
+
+    # The sample is already sorted, so the 10-bin counts are just the gaps
+    # between where the bin edges fall in it (last bin closed, as in
+    # np.histogram); no second pass over the samples is needed
+    edges = np.linspace(0.0, 1.0, 11)
+    positions = np.searchsorted(normalized, edges, side="left")
+    positions[-1] = np.searchsorted(normalized, 1.0, side="right")
+    observed = np.diff(positions)
+
+    return float(max(d_plus, d_minus)), observed, n
+
+
+class NumberAnalyzer:
+    """
+    A class to analyze the distribution and consistency of generated numbers.
+    """
+
+    @staticmethod
+    def _collect_samples(
+        data: Dict, ranges: List[Tuple[float, float]]
+    ) -> Tuple[Dict[str, np.ndarray], pd.DataFrame]:
+        """
+        Copy every sample into one array, grouped by range, in a single pass.
+
+        Rows are ordered range by range, runs in order within each range, so
+        each range's samples are a contiguous slice of the value column.
+
+        Args:
+            data (Dict): Generated data across runs
+            ranges (List[Tuple[float, float]]): List of ranges
+
+        Returns:
+            Tuple[Dict[str, np.ndarray], pd.DataFrame]: Per-range views of the
+            samples, for ranges with at least one sample, and the long frame
+            with columns "run", "range" (categoricals in run and range order)
+            and "value"
+        """
+        run_keys = list(data)
+        range_keys = list(dict.fromkeys(f"{lo}-{hi}" for lo, hi in ranges))
+        range_codes = {range_key: i for i, range_key in enumerate(range_keys)}
+
+        # Invert runs -> ranges, skipping empty runs
+        chunks_by_range = [[] for _ in range_keys]
+        runs_by_range = [[] for _ in range_keys]
+        for i, run_data in enumerate(data.values()):
+            for range_key, numbers in run_data.items():
+                code = range_codes.get(range_key)
+                if code is not None and len(numbers):
+                    chunks_by_range[code].append(numbers)
+                    runs_by_range[code].append(i)
+
+        chunks = [chunk for group in chunks_by_range for chunk in group]
+        lengths = [len(chunk) for chunk in chunks]
+        values = (
+            np.concatenate(chunks, dtype=SAMPLE_DTYPE)
+            if chunks
+            else np.empty(0, SAMPLE_DTYPE)
+        )
+
+        by_range = {}
+        start = 0
+        for range_key, group in zip(range_keys, chunks_by_range):
+            stop = start + sum(len(chunk) for chunk in group)
+            if stop > start:
+                by_range[range_key] = values[start:stop]
+            start = stop
+
+        run_idx = [i for group in runs_by_range for i in group]
+        range_idx = [code for code, group in enumerate(runs_by_range) for _ in group]
+        frame = pd.DataFrame(
+            {
+                "run": pd.Categorical.from_codes(
+                    np.repeat(np.array(run_idx, dtype=np.intp), lengths), run_keys
+                ),
+                "range": pd.Categorical.from_codes(
+                    np.repeat(np.array(range_idx, dtype=np.intp), lengths),
+                    range_keys,
+                ),
+                "value": values,
+            },
+            copy=False,
+        )
+
+        return by_range, frame
 
     def analyze_distribution(self, results: Dict) -> Dict:
         """
@@ -35,38 +249,34 @@ class NumberAnalyzer:
 
         ranges = results["ranges"]
         data = results["data"]
+        by_range, frame = self._collect_samples(data, ranges)
 
         # Analyze each range
         for min_val, max_val in ranges:
             range_key = f"{min_val}-{max_val}"
-            all_numbers = []
+            numbers_array = by_range.get(range_key)
 
-            # Collect all numbers for this range across all runs
-            for run_key, run_data in data.items():
-                if range_key in run_data:
-                    all_numbers.extend(run_data[range_key])
-
-            if all_numbers:
-                numbers_array = np.array(all_numbers)
+            if numbers_array is not None:
                 expected_mean = (min_val + max_val) / 2
                 expected_std = (max_val - min_val) / np.sqrt(
                     12
                 )  # For uniform distribution
 
+                n, actual_mean, actual_std, actual_min, actual_max, coverage = (
+                    _range_stats(numbers_array, min_val, max_val)
+                )
+
                 analysis["range_analysis"][range_key] = {
-                    "total_samples": len(numbers_array),
-                    "actual_mean": float(np.mean(numbers_array)),
+                    "total_samples": n,
+                    "actual_mean": actual_mean,
                     "expected_mean": expected_mean,
-                    "mean_bias": float(np.mean(numbers_array) - expected_mean),
-                    "actual_std": float(np.std(numbers_array)),
+                    "mean_bias": actual_mean - expected_mean,
+                    "actual_std": actual_std,
                     "expected_std": expected_std,
-                    "std_ratio": float(np.std(numbers_array) / expected_std),
-                    "min": float(np.min(numbers_array)),
-                    "max": float(np.max(numbers_array)),
-                    "range_coverage": float(
-                        (np.max(numbers_array) - np.min(numbers_array))
-                        / (max_val - min_val)
-                    ),
+                    "std_ratio": float(actual_std / expected_std),
+                    "min": actual_min,
+                    "max": actual_max,
+                    "range_coverage": coverage,
                     "uniformity_test": self._test_uniformity(
                         numbers_array, min_val, max_val
                     ),
@@ -78,7 +288,7 @@ class NumberAnalyzer:
         )
 
         # Analyze consistency across runs
-        analysis["consistency_analysis"] = self._analyze_consistency(data, ranges)
+        analysis["consistency_analysis"] = self._analyze_consistency(frame)
 
         return analysis
 
@@ -96,27 +306,26 @@ class NumberAnalyzer:
         Returns:
             Dict: Uniformity test results
         """
-        # Normalize numbers to [0, 1] range
-        normalized = (numbers - min_val) / (max_val - min_val)
+        ks_statistic, observed, n = _uniformity_kernel(numbers, min_val, max_val)
 
-        # Perform Kolmogorov-Smirnov test for uniformity
-        ks_statistic, p_value = stats.kstest(normalized, "uniform")
+        # P-values come from scipy once the statistics are known; the KS one
+        # uses the exact distribution, as stats.kstest does
+        p_value = min(max(stats.kstwo.sf(ks_statistic, n), 0.0), 1.0)
 
-        # Perform chi-square test (divide into bins)
-        bins = np.linspace(0, 1, 11)  # 10 bins
-        observed, _ = np.histogram(normalized, bins=bins)
-        expected = (
-            len(normalized) / 10
-        )  # Expected count per bin for uniform distribution
-        chi2_statistic, chi2_p_value = stats.chisquare(observed, [expected] * 10)
+        # Perform chi-square test (10 bins); the expected count is the same for
+        # every bin, so the statistic is a single vector expression
+        expected = n / 10  # Expected count per bin for uniform distribution
+        diff = observed - expected
+        chi2_statistic = float(np.dot(diff, diff) / expected)
+        chi2_p_value = float(stats.chi2.sf(chi2_statistic, df=9))
 
         return {
             "ks_statistic": float(ks_statistic),
             "ks_p_value": float(p_value),
-            "is_uniform_ks": p_value > 0.05,
+            "is_uniform_ks": bool(p_value > 0.05),
             "chi2_statistic": float(chi2_statistic),
             "chi2_p_value": float(chi2_p_value),
-            "is_uniform_chi2": chi2_p_value > 0.05,
+            "is_uniform_chi2": bool(chi2_p_value > 0.05),
         }
 
     def _analyze_bias_patterns(self, range_analysis: Dict) -> Dict:
@@ -129,64 +338,62 @@ class NumberAnalyzer:
         Returns:
             Dict: Bias pattern analysis
         """
-        biases = []
-        ranges = []
-
-        for range_key, analysis in range_analysis.items():
-            biases.append(analysis["mean_bias"])
-            ranges.append(range_key)
+        ranges = list(range_analysis)
+        biases = np.fromiter(
+            (analysis["mean_bias"] for analysis in range_analysis.values()),
+            dtype=np.float64,
+            count=len(ranges),
+        )
 
         return {
-            "mean_bias": float(np.mean(biases)),
-            "bias_std": float(np.std(biases)),
-            "bias_range": float(np.max(biases) - np.min(biases)),
-            "bias_by_range": dict(zip(ranges, biases)),
+            "mean_bias": float(biases.mean()),
+            "bias_std": float(biases.std()),
+            "bias_range": float(biases.max() - biases.min()),
+            "bias_by_range": dict(zip(ranges, biases.tolist())),
         }
 
-    def _analyze_consistency(
-        self, data: Dict, ranges: List[Tuple[float, float]]
-    ) -> Dict:
+    def _analyze_consistency(self, frame: pd.DataFrame) -> Dict:
         """
         Analyze consistency across different runs.
 
         Args:
-            data (Dict): Generated data across runs
-            ranges (List[Tuple[float, float]]): List of ranges
+            frame (pd.DataFrame): Long-format samples from _collect_samples()
 
         Returns:
             Dict: Consistency analysis results
         """
-        consistency = {}
-
-        for min_val, max_val in ranges:
-            range_key = f"{min_val}-{max_val}"
-            run_means = []
-            run_stds = []
+        # Mean and std of every (range, run) group, then their spread per range
+        per_run = frame.groupby(["range", "run"], observed=True, sort=False)["value"]
+        run_stats = pd.DataFrame({"mean": per_run.mean(), "std": per_run.std(ddof=0)})
 
-            for run_key, run_data in data.items():
-                if range_key in run_data and run_data[range_key]:
-                    numbers = np.array(run_data[range_key])
-                    run_means.append(np.mean(numbers))
-                    run_stds.append(np.std(numbers))
+        by_range = run_stats.groupby(level="range", observed=True, sort=False)
+        spread = by_range.std(ddof=0)  # Lower is more consistent
+        center = by_range.mean()
+        cv = spread / center  # Coefficient of variation
+        run_means = by_range["mean"].agg(list)
+        run_stds = by_range["std"].agg(list)
 
-            if run_means:
+        consistency = {}
+        for range_key in frame["range"].cat.categories:
+            if range_key in spread.index:
                 consistency[range_key] = {
-                    "mean_consistency": float(
-                        np.std(run_means)
-                    ),  # Lower is more consistent
-                    "std_consistency": float(np.std(run_stds)),
-                    "cv_mean": float(
-                        np.std(run_means) / np.mean(run_means)
-                    ),  # Coefficient of variation
-                    "cv_std": float(np.std(run_stds) / np.mean(run_stds)),
-                    "run_means": [float(m) for m in run_means],
-                    "run_stds": [float(s) for s in run_stds],
+                    "mean_consistency": float(spread.at[range_key, "mean"]),
+                    "std_consistency": float(spread.at[range_key, "std"]),
+                    "cv_mean": float(cv.at[range_key, "mean"]),
+                    "cv_std": float(cv.at[range_key, "std"]),
+                    "run_means": [float(m) for m in run_means[range_key]],
+                    "run_stds": [float(s) for s in run_stds[range_key]],
                 }
 
         return consistency
 
     def create_visualizations(
-        self, results: Dict, analysis: Dict, save_path: str = "analysis_results"
+        self,
+        results: Dict,
+        analysis: Dict,
+        save_path: str = "analysis_results",
+        fig=None,
+        show: bool = False,
     ):
         """
         Create comprehensive visualizations of the analysis results.
@@ -195,50 +402,70 @@ class NumberAnalyzer:
             results (Dict): Results from NumberGenerator.run_consistency_test()
             analysis (Dict): Analysis results from analyze_distribution()
             save_path (str): Path to save the visualizations
+            fig: Optional matplotlib Figure to draw into; it is cleared first
+                and left open so it can be reused for the next call
+            show (bool): Display the figure after saving it
         """
-        # Create figure with subplots
-        fig = plt.figure(figsize=(20, 16))
-
-        # 1. Distribution plots for each range
-        self._plot_distributions(results, fig, 2, 3, 1)
+        plt = _pyplot()
+
+        # Create figure with subplots, or reuse the caller's one
+        owns_figure = fig is None
+        if owns_figure:
+            fig, axes = plt.subplots(2, 3, figsize=(20, 16), constrained_layout=True)
+        else:
+            fig.clear()
+            fig.set_layout_engine("constrained")
+            axes = fig.subplots(2, 3)
+        axes = axes.flat
+
+        # Per-range values shared by the bar charts below
+        plot_arrays = self._build_plot_arrays(analysis)
+
+        # 1. Distribution plots for each range, from this call's data
+        self._plot_distributions(
+            self._collect_samples(results["data"], results["ranges"])[0],
+            results["ranges"],
+            axes[0],
+        )
 
         # 2. Bias analysis
-        self._plot_bias_analysis(analysis, fig, 2, 3, 2)
+        self._plot_bias_analysis(plot_arrays, axes[1])
 
         # 3. Consistency across runs
-        self._plot_consistency(analysis, fig, 2, 3, 3)
+        self._plot_consistency(plot_arrays, axes[2])
 
         # 4. Uniformity test results
-        self._plot_uniformity_tests(analysis, fig, 2, 3, 4)
+        self._plot_uniformity_tests(plot_arrays, axes[3])
 
         # 5. Range coverage analysis
-        self._plot_range_coverage(analysis, fig, 2, 3, 5)
+        self._plot_range_coverage(plot_arrays, axes[4])
 
         # 6. Summary statistics
-        self._plot_summary_stats(results, fig, 2, 3, 6)
+        self._plot_summary_stats(analysis, axes[5])
 
-        plt.tight_layout()
-        plt.savefig(f"{save_path}_visualizations.png", dpi=300, bbox_inches="tight")
-        plt.show()
+        fig.savefig(f"{save_path}_visualizations.png", dpi=300, bbox_inches="tight")
 
-    def _plot_distributions(self, results: Dict, fig, rows: int, cols: int, pos: int):
-        """Plot distributions for each range."""
-        ax = plt.subplot(rows, cols, pos)
-
-        data = results["data"]
-        ranges = results["ranges"]
+        if show:
+            plt.show()
+        elif owns_figure:
+            plt.close(fig)
 
+    def _plot_distributions(
+        self, by_range: Dict[str, np.ndarray], ranges: List[Tuple[float, float]], ax
+    ):
+        """Plot distributions for each range."""
         for min_val, max_val in ranges:
             range_key = f"{min_val}-{max_val}"
-            all_numbers = []
-
-            for run_key, run_data in data.items():
-                if range_key in run_data:
-                    all_numbers.extend(run_data[range_key])
-
-            if all_numbers:
-                ax.hist(
-                    all_numbers, alpha=0.6, label=f"[{min_val}, {max_val}]", bins=20
+            if range_key in by_range:
+                # Bin over the requested range directly rather than letting
+                # ax.hist re-derive edges from the data
+                counts = _uniform_bin_counts(by_range[range_key], min_val, max_val, 20)
+                ax.stairs(
+                    counts,
+                    np.linspace(min_val, max_val, 21),
+                    fill=True,
+                    alpha=0.6,
+                    label=f"[{min_val}, {max_val}]",
                 )
 
         ax.set_xlabel("Generated Numbers")
@@ -247,67 +474,86 @@ class NumberAnalyzer:
         ax.legend()
         ax.grid(True, alpha=0.3)
 
-    def _plot_bias_analysis(self, analysis: Dict, fig, rows: int, cols: int, pos: int):
-        """Plot bias analysis."""
-        ax = plt.subplot(rows, cols, pos)
+    @staticmethod
+    def _build_plot_arrays(analysis: Dict) -> Dict:
+        """
+        Gather the per-range values the bar-chart plotters need, once.
 
+        Args:
+            analysis (Dict): Analysis results from analyze_distribution()
+
+        Returns:
+            Dict: Range labels and one array per plotted metric
+        """
         range_analysis = analysis["range_analysis"]
-        ranges = list(range_analysis.keys())
-        biases = [range_analysis[r]["mean_bias"] for r in ranges]
+        consistency = analysis["consistency_analysis"]
+        count = len(range_analysis)
 
-        bars = ax.bar(range(len(ranges)), biases)
+        def column(values, size=count):
+            return np.fromiter(values, dtype=np.float64, count=size)
+
+        return {
+            "ranges": list(range_analysis),
+            "biases": column(a["mean_bias"] for a in range_analysis.values()),
+            "coverages": column(a["range_coverage"] for a in range_analysis.values()),
+            "ks_p_values": column(
+                a["uniformity_test"]["ks_p_value"] for a in range_analysis.values()
+            ),
+            "chi2_p_values": column(
+                a["uniformity_test"]["chi2_p_value"] for a in range_analysis.values()
+            ),
+            "consistency_ranges": list(consistency),
+            "cv_means": column(
+                (c["cv_mean"] for c in consistency.values()), len(consistency)
+            ),
+        }
+
+    def _plot_bias_analysis(self, plot_arrays: Dict, ax):
+        """Plot bias analysis."""
+        ranges = plot_arrays["ranges"]
+        biases = plot_arrays["biases"]
+        x = np.arange(len(ranges))
+
+        # Color bars based on bias direction
+        ax.bar(x, biases, color=np.where(biases > 0, "red", "blue"))
         ax.set_xlabel("Range")
         ax.set_ylabel("Mean Bias")
         ax.set_title("Bias Analysis by Range")
-        ax.set_xticks(range(len(ranges)))
+        ax.set_xticks(x)
         ax.set_xticklabels(ranges, rotation=45)
 
-        # Color bars based on bias direction
-        for bar, bias in zip(bars, biases):
-            if bias > 0:
-                bar.set_color("red")
-            else:
-                bar.set_color("blue")
-
         ax.axhline(y=0, color="black", linestyle="-", alpha=0.5)
         ax.grid(True, alpha=0.3)
 
-    def _plot_consistency(self, analysis: Dict, fig, rows: int, cols: int, pos: int):
+    def _plot_consistency(self, plot_arrays: Dict, ax):
         """Plot consistency across runs."""
-        ax = plt.subplot(rows, cols, pos)
-
-        consistency = analysis["consistency_analysis"]
-        ranges = list(consistency.keys())
-        cv_means = [consistency[r]["cv_mean"] for r in ranges]
+        ranges = plot_arrays["consistency_ranges"]
+        x = np.arange(len(ranges))
 
-        ax.bar(range(len(ranges)), cv_means)
+        ax.bar(x, plot_arrays["cv_means"])
         ax.set_xlabel("Range")
         ax.set_ylabel("Coefficient of Variation (Mean)")
         ax.set_title("Consistency Across Runs")
-        ax.set_xticks(range(len(ranges)))
+        ax.set_xticks(x)
         ax.set_xticklabels(ranges, rotation=45)
         ax.grid(True, alpha=0.3)
 
-    def _plot_uniformity_tests(
-        self, analysis: Dict, fig, rows: int, cols: int, pos: int
-    ):
+    def _plot_uniformity_tests(self, plot_arrays: Dict, ax):
         """Plot uniformity test results."""
-        ax = plt.subplot(rows, cols, pos)
-
-        range_analysis = analysis["range_analysis"]
-        ranges = list(range_analysis.keys())
-        ks_p_values = [
-            range_analysis[r]["uniformity_test"]["ks_p_value"] for r in ranges
-        ]
-        chi2_p_values = [
-            range_analysis[r]["uniformity_test"]["chi2_p_value"] for r in ranges
-        ]
-
+        ranges = plot_arrays["ranges"]
         x = np.arange(len(ranges))
         width = 0.35
 
-        ax.bar(x - width / 2, ks_p_values, width, label="KS Test", alpha=0.7)
-        ax.bar(x + width / 2, chi2_p_values, width, label="Chi² Test", alpha=0.7)
+        ax.bar(
+            x - width / 2, plot_arrays["ks_p_values"], width, label="KS Test", alpha=0.7
+        )
+        ax.bar(
+            x + width / 2,
+            plot_arrays["chi2_p_values"],
+            width,
+            label="Chi² Test",
+            alpha=0.7,
+        )
 
         ax.set_xlabel("Range")
         ax.set_ylabel("P-value")
@@ -318,50 +564,36 @@ class NumberAnalyzer:
         ax.legend()
         ax.grid(True, alpha=0.3)
 
-    def _plot_range_coverage(self, analysis: Dict, fig, rows: int, cols: int, pos: int):
+    def _plot_range_coverage(self, plot_arrays: Dict, ax):
         """Plot range coverage analysis."""
-        ax = plt.subplot(rows, cols, pos)
-
-        range_analysis = analysis["range_analysis"]
-        ranges = list(range_analysis.keys())
-        coverages = [range_analysis[r]["range_coverage"] for r in ranges]
+        ranges = plot_arrays["ranges"]
+        x = np.arange(len(ranges))
 
-        ax.bar(range(len(ranges)), coverages)
+        ax.bar(x, plot_arrays["coverages"])
         ax.set_xlabel("Range")
         ax.set_ylabel("Coverage Ratio")
         ax.set_title("Range Coverage Analysis")
-        ax.set_xticks(range(len(ranges)))
+        ax.set_xticks(x)
         ax.set_xticklabels(ranges, rotation=45)
         ax.axhline(y=1.0, color="red", linestyle="--", alpha=0.7, label="Full Coverage")
         ax.legend()
         ax.grid(True, alpha=0.3)
 
-    def _plot_summary_stats(self, results: Dict, fig, rows: int, cols: int, pos: int):
+    def _plot_summary_stats(self, analysis: Dict, ax):
         """Plot summary statistics."""
-        ax = plt.subplot(rows, cols, pos)
-
-        # Create a summary table
-        stats_data = []
-        for min_val, max_val in results["ranges"]:
-            range_key = f"{min_val}-{max_val}"
-            all_numbers = []
-
-            for run_key, run_data in results["data"].items():
-                if range_key in run_data:
-                    all_numbers.extend(run_data[range_key])
-
-            if all_numbers:
-                numbers_array = np.array(all_numbers)
-                stats_data.append(
-                    [
-                        range_key,
-                        len(numbers_array),
-                        f"{np.mean(numbers_array):.3f}",
-                        f"{np.std(numbers_array):.3f}",
-                        f"{np.min(numbers_array):.3f}",
-                        f"{np.max(numbers_array):.3f}",
-                    ]
-                )
+        # Create a summary table from the statistics analyze_distribution
+        # already computed
+        stats_data = [
+            [
+                range_key,
+                range_analysis["total_samples"],
+                f"{range_analysis['actual_mean']:.3f}",
+                f"{range_analysis['actual_std']:.3f}",
+                f"{range_analysis['min']:.3f}",
+                f"{range_analysis['max']:.3f}",
+            ]
+            for range_key, range_analysis in analysis["range_analysis"].items()
+        ]
 
         # Create table
         table = ax.table(
@@ -394,8 +626,15 @@ class NumberAnalyzer:
             "summary": self._create_summary(analysis),
         }
 
-        with open(filename, "w") as f:
-            json.dump(output, f, indent=2, default=str)
+        if orjson is not None:
+            payload = orjson.dumps(
+                output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+            with open(filename, "wb") as f:
+                f.write(payload)
+        else:
+            with open(filename, "w") as f:
+                json.dump(output, f, indent=2, default=str)
 
         print(f"Results saved to {filename}")
 
@@ -413,15 +652,28 @@ class NumberAnalyzer:
         bias_analysis = analysis["bias_analysis"]
         consistency_analysis = analysis["consistency_analysis"]
 
+        # Largest absolute bias and largest absolute CV of the run means. The CV
+        # takes the sign of the mean, so negative ranges compare by magnitude
+        bias_keys = list(bias_analysis["bias_by_range"])
+        biases = np.fromiter(
+            bias_analysis["bias_by_range"].values(),
+            dtype=np.float64,
+            count=len(bias_keys),
+        )
+        consistency_keys = list(consistency_analysis)
+        cv_means = np.fromiter(
+            (consistency_analysis[k]["cv_mean"] for k in consistency_keys),
+            dtype=np.float64,
+            count=len(consistency_keys),
+        )
+
         summary = {
             "total_ranges_tested": len(range_analysis),
             "overall_bias": bias_analysis["mean_bias"],
-            "most_biased_range": max(
-                bias_analysis["bias_by_range"].items(), key=lambda x: abs(x[1])
-            )[0],
-            "least_consistent_range": min(
-                consistency_analysis.items(), key=lambda x: x[1]["cv_mean"]
-            )[0],
+            "most_biased_range": bias_keys[int(np.argmax(np.abs(biases)))],
+            "least_consistent_range": consistency_keys[
+                int(np.argmax(np.abs(cv_means)))
+            ],
             "uniformity_findings": {},
         }
 
@@ -4,7 +4,13 @@ Example analysis script demonstrating various use cases for the number generatio
 This script shows how to perform specific research tasks and custom analysis.
 """
 
-from number_generator import NumberGenerator
+from concurrent.futures import ThreadPoolExecutor
+from number_generator import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_RPM,
+    DEFAULT_TPM,
+    NumberGenerator,
+)
 from analyzer import NumberAnalyzer
 import matplotlib.pyplot as plt
 import numpy as np
@@ -22,17 +28,21 @@ def compare_models():
     samples_per_range = 30
     runs = 2
 
-    results = {}
-
-    for model in models:
+    def test_model(model):
         print(f"\n📊 Testing {model}...")
         generator = NumberGenerator(model=model)
 
-        model_results = generator.run_consistency_test(
-            ranges=ranges, samples_per_range=samples_per_range, runs=runs
-        )
+        try:
+            return generator.run_consistency_test(
+                ranges=ranges, samples_per_range=samples_per_range, runs=runs
+            )
+        finally:
+            generator.close()
 
-        results[model] = model_results
+    # Generation is bound by API latency, so test the models concurrently
+    with ThreadPoolExecutor(max_workers=len(models)) as executor:
+        futures = {model: executor.submit(test_model, model) for model in models}
+        results = {model: future.result() for model, future in futures.items()}
 
     # Analyze and compare
     analyzer = NumberAnalyzer()
@@ -62,23 +72,40 @@ def test_prompt_strategies():
     samples_per_range = 25
     runs = 2
 
-    generator = NumberGenerator()
-    analyzer = NumberAnalyzer()
+    # The strategies run concurrently, so each one's generator gets an equal
+    # share of the default limits and together they stay within them
+    share = len(prompt_types)
 
-    prompt_results = {}
+    analyzer = NumberAnalyzer()
 
-    for prompt_type in prompt_types:
+    def test_prompt(prompt_type):
         print(f"\n📝 Testing '{prompt_type}' prompt strategy...")
-
-        results = generator.run_consistency_test(
-            ranges=ranges,
-            samples_per_range=samples_per_range,
-            runs=runs,
-            prompt_type=prompt_type,
+        generator = NumberGenerator(
+            max_concurrent_requests=DEFAULT_MAX_CONCURRENT_REQUESTS // share,
+            rpm=DEFAULT_RPM // share,
+            tpm=DEFAULT_TPM // share,
         )
 
-        analysis = analyzer.analyze_distribution(results)
-        prompt_results[prompt_type] = analysis
+        try:
+            return generator.run_consistency_test(
+                ranges=ranges,
+                samples_per_range=samples_per_range,
+                runs=runs,
+                prompt_type=prompt_type,
+            )
+        finally:
+            generator.close()
+
+    # Generation is bound by API latency, so run the strategies concurrently
+    with ThreadPoolExecutor(max_workers=len(prompt_types)) as executor:
+        futures = {
+            prompt_type: executor.submit(test_prompt, prompt_type)
+            for prompt_type in prompt_types
+        }
+        prompt_results = {
+            prompt_type: analyzer.analyze_distribution(future.result())
+            for prompt_type, future in futures.items()
+        }
 
     # Compare prompt strategies
     print(f"\n📊 Prompt Strategy Comparison:")
@@ -115,6 +142,7 @@ def analyze_specific_bias():
     results = generator.run_consistency_test(
         ranges=ranges, samples_per_range=samples_per_range, runs=runs
     )
+    generator.close()
 
     analysis = analyzer.analyze_distribution(results)
 
@@ -147,6 +175,7 @@ def test_consistency_over_time():
     results = generator.run_consistency_test(
         ranges=ranges, samples_per_range=samples_per_range, runs=runs
     )
+    generator.close()
 
     analysis = analyzer.analyze_distribution(results)
 
@@ -178,10 +207,12 @@ def create_custom_visualization():
     results = generator.run_consistency_test(
         ranges=ranges, samples_per_range=samples_per_range, runs=runs
     )
+    generator.close()
 
     analysis = analyzer.analyze_distribution(results)
 
     # Create a custom focused visualization
+    plt.style.use("seaborn-v0_8")
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
 
     # 1. Bias comparison
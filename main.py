@@ -71,11 +71,10 @@ def main():
             runs=runs,
             prompt_type=prompt_type,
         )
+        generator.close()
 
         print(f"\n✅ Number generation completed!")
-        print(
-            f"   - Total numbers generated: {sum(len(run_data[range_key]) for run_key, run_data in results['data'].items() for range_key in run_data)}"
-        )
+        print(f"   - Total numbers generated: {results['statistics']['total_count']}")
 
         # Analyze the results
         print(f"\n📈 Analyzing results...")
@@ -173,6 +172,7 @@ def run_quick_test():
         results = generator.run_consistency_test(
             ranges=ranges, samples_per_range=samples_per_range, runs=runs
         )
+        generator.close()
 
         analysis = analyzer.analyze_distribution(results)
 
@@ -0,0 +1,164 @@
+"""
+On-disk cache of raw model responses, keyed by the SHA256 of the request.
+Re-running a consistency test against a populated cache costs no API calls.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional, Tuple
+
+CACHE_MODES = ("enabled", "read-only", "replay", "disabled")
+
+# Stored for a request that failed or came back empty, so a replay drops the
+# sample instead of missing it
+NO_ANSWER = ""
+
+
+class CacheMissError(KeyError):
+    """
+    Raised in replay mode when a request has no cached response.
+    """
+
+
+class ResponseCache:
+    """
+    SQLite-backed store of model responses.
+
+    Modes:
+        enabled: read cached responses and store new ones
+        read-only: read cached responses, never store
+        replay: read cached responses, raise CacheMissError on a miss
+        disabled: bypass the cache entirely
+
+    A recorded NO_ANSWER is returned only in replay mode; the other modes
+    treat it as a miss, so the request is tried again.
+    """
+
+    def __init__(self, path: str = "number_cache.sqlite", mode: str = "enabled"):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path (str): Path of the SQLite database file
+            mode (str): One of "enabled", "read-only", "replay", "disabled"
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(
+                f"Unknown cache mode '{mode}'. Expected one of: {', '.join(CACHE_MODES)}"
+            )
+
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._conn = None
+
+        if mode == "disabled":
+            return
+
+        # One connection shared by every thread, serialized by the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, response TEXT, ts INTEGER)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        provider: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        nonce: str,
+    ) -> str:
+        """
+        Build the content address of a request.
+
+        Args:
+            model (str): Model name
+            provider (str): API base URL
+            prompt (str): Full prompt text
+            temperature (float): Sampling temperature
+            max_tokens (int): Completion token limit
+            nonce (str): Call index, so repeated samples get distinct entries
+
+        Returns:
+            str: Hex SHA256 digest of the request fields
+        """
+        fields = f"{model}|{provider}|{prompt}|{temperature}|{max_tokens}|{nonce}"
+        return hashlib.sha256(fields.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key (str): Request key from make_key
+
+        Returns:
+            Optional[str]: Cached response text (NO_ANSWER for a recorded
+                non-answer in replay mode), or None on a miss
+        """
+        if self._conn is None:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            if self.mode == "replay":
+                raise CacheMissError(key)
+            return None
+
+        if row[0] == NO_ANSWER and self.mode != "replay":
+            return None
+
+        return row[0]
+
+    def put(self, key: str, response: str):
+        """
+        Store a response, unless the cache is read-only, replaying or disabled.
+
+        Args:
+            key (str): Request key from make_key
+            response (str): Raw response text
+        """
+        self.put_many([(key, response)])
+
+    def put_many(self, items: Iterable[Tuple[str, str]]):
+        """
+        Store a batch of responses in one transaction, like put.
+
+        Args:
+            items (Iterable[Tuple[str, str]]): (key, response) pairs
+        """
+        if self._conn is None or self.mode != "enabled":
+            return
+
+        ts = int(time.time())
+        rows = [(key, response, ts) for key, response in items]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
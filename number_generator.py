@@ -1,11 +1,283 @@
 import os
+import re
 import json
 import time
 import random
-from typing import List, Dict, Tuple, Optional
-from openai import OpenAI
-from dotenv import load_dotenv
+import asyncio
+import threading
+from typing import Awaitable, Callable, List, Dict, Tuple, Optional
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+import httpx
 import numpy as np
+from number_cache import NO_ANSWER, ResponseCache
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib decoder
+    orjson = None
+
+try:
+    import anthropic
+except ImportError:  # Optional: Claude goes through the OpenAI-compatible API
+    anthropic = None
+
+try:
+    from tqdm import tqdm
+except ImportError:  # Optional: no progress bar, just the start message
+    tqdm = None
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # Optional: read the API keys from the environment only
+    load_dotenv = None
+
+# Default request concurrency and account rate limits of a generator
+DEFAULT_MAX_CONCURRENT_REQUESTS = 32
+DEFAULT_RPM = 3500
+DEFAULT_TPM = 90000
+
+# Attempts per request before a transient failure is given up on
+MAX_ATTEMPTS = 5
+
+# Bounds in seconds of the jittered exponential wait between attempts
+BACKOFF_MIN = 1
+BACKOFF_MAX = 30
+
+# Failures worth retrying; anything else (bad request, auth) fails at once.
+# The SDK clients are built with max_retries=0, so this covers the server
+# errors they would otherwise have retried themselves
+_TRANSIENT_ERRORS = (
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+)
+if anthropic is not None:
+    _TRANSIENT_ERRORS += (
+        anthropic.RateLimitError,
+        anthropic.APIConnectionError,
+        anthropic.APITimeoutError,
+        anthropic.InternalServerError,
+        # 529 responses; older releases raise InternalServerError for them
+        getattr(anthropic, "OverloadedError", anthropic.InternalServerError),
+    )
+
+# User prompts by prompt type, filled in with the range bounds
+_PROMPT_TEMPLATES = {
+    "direct": "Generate a random number between {lo} and {hi}. Return only the number, no explanation.",
+    "creative": "Imagine you're a random number generator. Pick any number between {lo} and {hi}. Just return the number.",
+    "precise": "Please provide exactly one number that falls within the range [{lo}, {hi}]. Return only the numeric value.",
+}
+
+# Shared by every request; never mutated
+_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a precise number generator. Always respond with only the requested number.",
+}
+
+# Cut free-text OpenAI completions off at the first line break, before any
+# explanation; not sent to Claude, which rejects whitespace-only stop
+# sequences, or in JSON mode, where the object may be pretty-printed
+_STOP = ["\n"]
+
+# Appended to the prompt in JSON mode; the API requires "JSON" to appear
+_JSON_INSTRUCTION = 'Respond with JSON {"n": <number>} only.'
+
+# A single, optionally signed, decimal or scientific-notation number
+_NUM_RE = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
+
+
+def _json_number_text(result: str) -> str:
+    """
+    Pull the "n" field out of a JSON-mode response.
+
+    Args:
+        result (str): Raw response text
+
+    Returns:
+        str: The "n" value as text, or the response unchanged if it is not a
+            JSON object with an "n" field
+    """
+    try:
+        payload = orjson.loads(result) if orjson is not None else json.loads(result)
+    except ValueError:  # orjson.JSONDecodeError and json's both subclass it
+        return result
+
+    if not isinstance(payload, dict) or "n" not in payload:
+        return result
+
+    return str(payload["n"])
+
+
+def _dumps_line(record: Dict) -> bytes:
+    """Serialize one record as a JSONL line."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record) + "\n").encode()
+
+
+def load_streamed_data(results_path: str) -> Dict:
+    """
+    Rebuild run_consistency_test's "data" dict from a streamed JSONL file.
+
+    Batches are written in completion order; runs are put back in run order
+    and ranges in the order they were first seen.
+
+    Args:
+        results_path (str): File written via run_consistency_test(results_path=...)
+
+    Returns:
+        Dict: {"run_<k>": {range_key: numbers}}, as in results["data"]
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    by_run: Dict[int, Dict[str, List[float]]] = {}
+    range_order: Dict[str, None] = {}
+
+    with open(results_path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = loads(line)
+            by_run.setdefault(record["run"], {})[record["range"]] = record["numbers"]
+            range_order.setdefault(record["range"])
+
+    return {
+        f"run_{run}": {
+            range_key: by_run[run][range_key]
+            for range_key in range_order
+            if range_key in by_run[run]
+        }
+        for run in sorted(by_run)
+    }
+
+
+def _filter_inrange(
+    values: np.ndarray, lo: float, hi: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split values into those within [lo, hi] and the rest, keeping order.
+
+    NaN compares false against both bounds, so it is always rejected. The
+    mask is built in place, and the usual all-in-range batch is returned
+    without copying.
+
+    Args:
+        values (np.ndarray): Parsed numbers
+        lo (float): Minimum allowed value
+        hi (float): Maximum allowed value
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (in-range values, rejected values)
+    """
+    mask = np.greater_equal(values, lo)
+    mask &= values <= hi
+
+    if mask.all():
+        return values, values[:0]
+
+    return values[mask], values[~mask]
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket limiting both requests and tokens per minute.
+
+    Each bucket refills continuously up to its per-minute capacity. A caller
+    reserves its share up front and sleeps off any deficit, so concurrent
+    callers are served in arrival order. State is guarded by a thread lock,
+    which lets one limiter be shared by event loops in different threads.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        """
+        Initialize the limiter with full buckets.
+
+        Args:
+            rpm (int): Requests allowed per minute
+            tpm (int): Tokens allowed per minute
+        """
+        self.r = rpm
+        self.t = tpm
+        self.request_tokens = float(rpm)
+        self.token_tokens = float(tpm)
+        self.last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self, estimated_tokens: int):
+        """
+        Wait until one request using estimated_tokens tokens fits the budget.
+
+        Args:
+            estimated_tokens (int): Expected prompt plus completion tokens
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_update
+            self.last_update = now
+
+            self.request_tokens = min(
+                self.r, self.request_tokens + elapsed * self.r / 60
+            )
+            self.token_tokens = min(self.t, self.token_tokens + elapsed * self.t / 60)
+
+            self.request_tokens -= 1
+            self.token_tokens -= estimated_tokens
+
+            wait_time = max(
+                -self.request_tokens * 60 / self.r,
+                -self.token_tokens * 60 / self.t,
+                0.0,
+            )
+
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+
+def _sorted_quantile(sorted_values: np.ndarray, q: float) -> float:
+    """
+    Linearly interpolated quantile of already-sorted values.
+
+    Matches np.percentile's default method, including its interpolation
+    arithmetic, without re-partitioning the array.
+
+    Args:
+        sorted_values (np.ndarray): Non-empty array in ascending order
+        q (float): Quantile in [0, 1]
+
+    Returns:
+        float: The q-th quantile
+    """
+    position = q * (sorted_values.size - 1)
+    lo = int(position)
+    hi = min(lo + 1, sorted_values.size - 1)
+    t = position - lo
+    below, above = sorted_values[lo], sorted_values[hi]
+    diff = above - below
+    if t >= 0.5:
+        return float(above - diff * (1 - t))
+    return float(below + diff * t)
+
+
+def _sorted_median(sorted_values: np.ndarray) -> float:
+    """
+    Median of already-sorted values, computed as np.median does.
+
+    Args:
+        sorted_values (np.ndarray): Non-empty array in ascending order
+
+    Returns:
+        float: The median
+    """
+    mid = sorted_values.size // 2
+    if sorted_values.size % 2:
+        return float(sorted_values[mid])
+    return float((sorted_values[mid - 1] + sorted_values[mid]) / 2)
 
 
 class NumberGenerator:
@@ -13,14 +285,41 @@ class NumberGenerator:
     A class to generate numbers using OpenAI models and analyze their distribution patterns.
     """
 
-    def __init__(self, model: str = "gpt-3.5-turbo"):
+    def __init__(
+        self,
+        model: str = "gpt-3.5-turbo",
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        rpm: int = DEFAULT_RPM,
+        tpm: int = DEFAULT_TPM,
+        cache_mode: str = "disabled",
+        cache_path: str = "number_cache.sqlite",
+        n_per_request: int = 20,
+        json_mode: bool = False,
+        http2: bool = False,
+    ):
         """
-        Initialize the NumberGenerator with OpenAI client.
+        Initialize the NumberGenerator with OpenAI client settings.
 
         Args:
             model (str): The OpenAI model to use for generation
+            max_concurrent_requests (int): Maximum number of API requests in
+                flight at once
+            rpm (int): Requests per minute allowed by the account's rate limit
+            tpm (int): Tokens per minute allowed by the account's rate limit
+            cache_mode (str): Response cache mode ("enabled", "read-only",
+                "replay", "disabled")
+            cache_path (str): Path of the SQLite response cache
+            n_per_request (int): Completions sampled per request via the n
+                parameter (OpenAI models only)
+            json_mode (bool): Ask for a {"n": number} JSON object through the
+                API's JSON response format (OpenAI models only); this changes
+                the prompt, so results are not comparable with free-text runs
+            http2 (bool): Multiplex the requests over HTTP/2 connections. Off
+                by default; needs the optional h2 package (pip install
+                "httpx[http2]")
         """
-        load_dotenv(override=True)
+        if load_dotenv is not None:
+            load_dotenv(override=True)
 
         if "gpt" in model:
             self.url = "https://api.openai.com/v1"
@@ -35,13 +334,114 @@ class NumberGenerator:
                 "API_KEY not found in environment variables. Please set it in your .env file."
             )
 
-        # Initialize OpenAI client with minimal configuration
-        print("Initializing OpenAI client... with model: ", model)
-        self.client = OpenAI(base_url=self.url, api_key=api_key)
-        print("OpenAI client initialized")
+        # The async client is bound to an event loop, so both are opened on
+        # first use (see _run) and kept until close()
+        self.api_key = api_key
+        self.max_concurrent_requests = max_concurrent_requests
+        self.http2 = http2
+        self.rate_limiter = AsyncRateLimiter(rpm, tpm)
+        self.cache = ResponseCache(cache_path, cache_mode)
+        # Anthropic's endpoint does not support n, so Claude samples one per call
+        self.n_per_request = n_per_request if "gpt" in model else 1
+        # Claude has no JSON response format; its answers use the regex parse
+        self.json_mode = json_mode and "gpt" in model
+        # Claude uses the native Messages API when the anthropic package is
+        # installed, and the OpenAI-compatible endpoint otherwise
+        self._provider = (
+            "anthropic" if "claude" in model and anthropic is not None else "openai"
+        )
         self.model = model
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._client = None
         print("Model set to: ", self.model)
 
+    def close(self):
+        """
+        Close the pooled API client, its event loop and the response cache's
+        database connection.
+        """
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+            if loop is not None:
+                asyncio.run_coroutine_threadsafe(
+                    self._http_client.aclose(), loop
+                ).result()
+                loop.call_soon_threadsafe(loop.stop)
+                self._loop_thread.join()
+                loop.close()
+                self._loop_thread = self._http_client = self._client = None
+
+        self.cache.close()
+
+    def _open_client(self):
+        """
+        Create the pooled async client; runs on the generator's event loop.
+
+        Returns:
+            AsyncOpenAI: The client (an AsyncAnthropic for the native
+                Anthropic provider)
+        """
+        # Pooled keep-alive connections, one slot per request in flight
+        limits = httpx.Limits(
+            max_connections=self.max_concurrent_requests,
+            max_keepalive_connections=self.max_concurrent_requests,
+        )
+        self._http_client = httpx.AsyncClient(
+            http2=self.http2,
+            limits=limits,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+        # SDK retries are off: _arequest is the only retry path, so every
+        # attempt goes through the rate limiter and is counted
+        if self._provider == "anthropic":
+            return anthropic.AsyncAnthropic(
+                api_key=self.api_key, http_client=self._http_client, max_retries=0
+            )
+        return AsyncOpenAI(
+            base_url=self.url,
+            api_key=self.api_key,
+            http_client=self._http_client,
+            max_retries=0,
+        )
+
+    def _run(self, make_coro: Callable[[AsyncOpenAI], Awaitable]):
+        """
+        Run a coroutine on the generator's event loop with its async client.
+
+        The loop runs on a background thread and the client is created on
+        first use, so every call, including single generate_number calls,
+        reuses the same pooled connections until close(). The call blocks
+        until the coroutine finishes, as the synchronous API always has, and
+        also works from a thread that already runs a loop (Jupyter, IPython).
+
+        Args:
+            make_coro (Callable[[AsyncOpenAI], Awaitable]): Builds the coroutine
+                to run from the client (an AsyncAnthropic for the native
+                Anthropic provider)
+
+        Returns:
+            The coroutine's result
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=loop.run_forever, name="NumberGenerator", daemon=True
+                )
+                self._loop_thread.start()
+                self._loop = loop
+            loop = self._loop
+
+        async def runner():
+            if self._client is None:
+                self._client = self._open_client()
+            return await make_coro(self._client)
+
+        return asyncio.run_coroutine_threadsafe(runner(), loop).result()
+
     def generate_number(
         self, min_val: float, max_val: float, prompt_type: str = "direct"
     ) -> Optional[float]:
@@ -56,57 +456,277 @@ class NumberGenerator:
         Returns:
             Optional[float]: Generated number or None if failed
         """
-        prompts = {
-            "direct": f"Generate a random number between {min_val} and {max_val}. Return only the number, no explanation.",
-            "creative": f"Imagine you're a random number generator. Pick any number between {min_val} and {max_val}. Just return the number.",
-            "precise": f"Please provide exactly one number that falls within the range [{min_val}, {max_val}]. Return only the numeric value.",
-        }
+        numbers = self._run(
+            lambda client: self._agenerate_samples(
+                client, asyncio.Semaphore(1), min_val, max_val, 1, prompt_type
+            )
+        )
+        return numbers[0] if numbers else None
 
-        prompt = prompts.get(prompt_type, prompts["direct"])
+    async def _arequest(
+        self,
+        client: AsyncOpenAI,
+        semaphore: asyncio.Semaphore,
+        messages: List[Dict],
+        k: int,
+        temperature: float,
+        max_tokens: int,
+        errors: Optional[Dict[str, int]] = None,
+    ) -> List[Optional[str]]:
+        """
+        Request k sampled completions of one prompt.
+
+        Transient failures are retried with jittered exponential backoff;
+        each retry goes back through the rate limiter.
+
+        Args:
+            client (AsyncOpenAI): Client to send the request with
+            semaphore (asyncio.Semaphore): Bounds the requests in flight
+            messages (List[Dict]): Chat messages to send
+            k (int): Number of completions, sent as n when greater than 1
+            temperature (float): Sampling temperature
+            max_tokens (int): Completion token limit per sample
+            errors (Optional[Dict[str, int]]): Counters of "retried" attempts
+                and "dropped" samples to update
+
+        Returns:
+            List[Optional[str]]: k response texts, None for failed samples
+        """
+        # Roughly four characters per token; the prompt is billed once
+        prompt_chars = sum(len(message["content"]) for message in messages)
+        estimated_tokens = prompt_chars // 4 + k * max_tokens
+        extra = {"n": k} if k > 1 else {}
+        if self.json_mode:
+            extra["response_format"] = {"type": "json_object"}
+        elif "gpt" in self.model:
+            extra["stop"] = _STOP
 
         try:
-            response = self.client.chat.completions.create(
+            for attempt in range(MAX_ATTEMPTS):
+                await self.rate_limiter.acquire(estimated_tokens)
+                try:
+                    async with semaphore:
+                        contents = await self._acreate(
+                            client, messages, temperature, max_tokens, extra
+                        )
+                    break
+                except _TRANSIENT_ERRORS:
+                    if attempt == MAX_ATTEMPTS - 1:
+                        raise
+                    if errors is not None:
+                        errors["retried"] += 1
+                    # Exponential backoff with full jitter
+                    ceiling = min(BACKOFF_MAX, BACKOFF_MIN * 2**attempt)
+                    await asyncio.sleep(max(BACKOFF_MIN, random.uniform(0, ceiling)))
+
+        except Exception as e:
+            print(f"Error generating number: {e}")
+            if errors is not None:
+                errors["dropped"] += k
+            return [None] * k
+
+        contents = contents[:k]
+        if not all(contents):
+            print("Warning: Empty response from model")
+        return contents + [None] * (k - len(contents))
+
+    async def _acreate(
+        self,
+        client: AsyncOpenAI,
+        messages: List[Dict],
+        temperature: float,
+        max_tokens: int,
+        extra: Dict,
+    ) -> List[Optional[str]]:
+        """
+        Send one completion request to the generator's provider.
+
+        Args:
+            client (AsyncOpenAI): Client from _run
+            messages (List[Dict]): System message followed by the user prompt
+            temperature (float): Sampling temperature
+            max_tokens (int): Completion token limit per sample
+            extra (Dict): Additional OpenAI parameters (n, response_format,
+                stop)
+
+        Returns:
+            List[Optional[str]]: Text of every returned completion
+        """
+        if self._provider == "anthropic":
+            system, *turns = messages
+            response = await client.messages.create(
                 model=self.model,
-                messages=[
+                # Flag the shared system prompt for Anthropic's prompt cache;
+                # it is only served from cache once prompts exceed the
+                # model's minimum cacheable length
+                system=[
                     {
-                        "role": "system",
-                        "content": "You are a precise number generator. Always respond with only the requested number.",
-                    },
-                    {"role": "user", "content": prompt},
+                        "type": "text",
+                        "text": system["content"],
+                        "cache_control": {"type": "ephemeral"},
+                    }
                 ],
-                temperature=0.7,
-                max_tokens=10,
+                messages=turns,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            text = "".join(
+                block.text for block in response.content if block.type == "text"
             )
+            return [text or None]
+
+        response = await client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **extra,
+        )
+        return [choice.message.content for choice in response.choices]
+
+    async def _agenerate_samples(
+        self,
+        client: AsyncOpenAI,
+        semaphore: asyncio.Semaphore,
+        min_val: float,
+        max_val: float,
+        count: int,
+        prompt_type: str = "direct",
+        nonce_prefix: Optional[str] = None,
+        errors: Optional[Dict[str, int]] = None,
+        progress=None,
+    ) -> List[float]:
+        """
+        Generate count numbers, packing up to n_per_request samples per request.
 
-            result = response.choices[0].message.content
-            if result is None:
-                print("Warning: Empty response from model")
-                return None
-
-            result = result.strip()
-
-            # Try to extract number from response
-            try:
-                # Remove any non-numeric characters except decimal points and minus signs
-                cleaned = "".join(c for c in result if c.isdigit() or c in ".-")
-                number = float(cleaned)
-
-                # Check if number is within range
-                if min_val <= number <= max_val:
-                    return number
-                else:
-                    print(
-                        f"Warning: Generated number {number} outside range [{min_val}, {max_val}]"
-                    )
-                    return None
+        Args:
+            client (AsyncOpenAI): Client to send the requests with
+            semaphore (asyncio.Semaphore): Bounds the requests in flight
+            min_val (float): Minimum value of the range
+            max_val (float): Maximum value of the range
+            count (int): Number of numbers to generate
+            prompt_type (str): Type of prompt to use ("direct", "creative", "precise")
+            nonce_prefix (Optional[str]): Prefix of each sample's cache nonce;
+                the samples are uncached when None
+            errors (Optional[Dict[str, int]]): Request failure counters, see
+                _arequest
+            progress: Optional tqdm bar advanced as samples are finished
+
+        Returns:
+            List[float]: List of generated numbers
+        """
+        prompt = _PROMPT_TEMPLATES.get(prompt_type, _PROMPT_TEMPLATES["direct"]).format(
+            lo=min_val, hi=max_val
+        )
+        if self.json_mode:
+            prompt = f"{prompt} {_JSON_INSTRUCTION}"
+        messages = [_SYSTEM_MSG, {"role": "user", "content": prompt}]
+        temperature = 0.7
+        # A bare number fits in a few tokens; the JSON wrapper needs more
+        max_tokens = 10 if self.json_mode else 8
+
+        # Samples are cached individually, keyed by their index in the batch
+        responses: List[Optional[str]] = [None] * count
+        keys: List[Optional[str]] = [None] * count
+        pending = []
+        for i in range(count):
+            if nonce_prefix is not None:
+                keys[i] = ResponseCache.make_key(
+                    self.model,
+                    self.url,
+                    prompt,
+                    temperature,
+                    max_tokens,
+                    f"{nonce_prefix}|{i}",
+                )
+                responses[i] = self.cache.get(keys[i])
+            if responses[i] is None:
+                pending.append(i)
+
+        chunks = [
+            pending[start : start + self.n_per_request]
+            for start in range(0, len(pending), self.n_per_request)
+        ]
+
+        async def request(chunk: List[int]) -> List[Optional[str]]:
+            contents = await self._arequest(
+                client,
+                semaphore,
+                messages,
+                len(chunk),
+                temperature,
+                max_tokens,
+                errors,
+            )
+            if progress is not None:
+                progress.update(len(chunk))
+            return contents
+
+        if progress is not None:
+            progress.update(count - len(pending))
+        fetched = await asyncio.gather(*(request(chunk) for chunk in chunks))
+
+        # New responses are stored in one cache transaction per call; failed
+        # and empty samples are recorded too, so a replay drops them again
+        to_store = []
+        for chunk, contents in zip(chunks, fetched):
+            for i, content in zip(chunk, contents):
+                responses[i] = content
+                if keys[i] is not None:
+                    to_store.append((keys[i], content or NO_ANSWER))
+        self.cache.put_many(to_store)
+
+        # Failed and empty samples were already reported by _arequest
+        return self._parse_and_filter_batch(
+            [result for result in responses if result],
+            min_val,
+            max_val,
+            self.json_mode,
+        )
+
+    @staticmethod
+    def _parse_and_filter_batch(
+        raws: List[str], min_val: float, max_val: float, json_mode: bool = False
+    ) -> List[float]:
+        """
+        Extract the in-range numbers from a batch of raw model responses.
 
-            except ValueError:
-                print(f"Warning: Could not parse number from response: '{result}'")
-                return None
+        Args:
+            raws (List[str]): Raw response texts
+            min_val (float): Minimum value of the range
+            max_val (float): Maximum value of the range
+            json_mode (bool): Read the number from a {"n": number} object,
+                falling back to the text scan if the response is not one
 
-        except Exception as e:
-            print(f"Error generating number: {e}")
-            return None
+        Returns:
+            List[float]: Parsed numbers within the range, in response order
+        """
+        tokens = []
+        for result in raws:
+            if json_mode:
+                result = _json_number_text(result)
+
+            # Extract the numeric token from the response; thousands
+            # separators are dropped first so "1,000" reads as one number
+            found = _NUM_RE.findall(result.replace(",", ""))
+            if len(found) == 1:
+                tokens.append(found[0])
+            else:
+                print(
+                    f"Warning: Could not parse number from response: '{result.strip()}'"
+                )
+
+        # One C-level cast and range check over the whole batch
+        numbers = np.array(tokens, dtype=np.str_).astype(np.float64)
+        kept, rejected = _filter_inrange(numbers, min_val, max_val)
+
+        if rejected.size:
+            print(
+                f"Warning: Generated numbers {rejected.tolist()} "
+                f"outside range [{min_val}, {max_val}]"
+            )
+
+        return kept.tolist()
 
     def generate_batch(
         self,
@@ -119,28 +739,30 @@ class NumberGenerator:
         """
         Generate a batch of numbers within the specified range.
 
+        Samples are packed n_per_request to a request, and up to
+        max_concurrent_requests API calls are in flight at once.
+
         Args:
             min_val (float): Minimum value of the range
             max_val (float): Maximum value of the range
             count (int): Number of numbers to generate
             prompt_type (str): Type of prompt to use
-            delay (float): Delay between API calls in seconds
+            delay (float): Ignored; requests are paced by the rpm/tpm rate
+                limiter. Kept so existing callers keep working
 
         Returns:
             List[float]: List of generated numbers
         """
-        numbers = []
-
-        for i in range(count):
-            number = self.generate_number(min_val, max_val, prompt_type)
-            if number is not None:
-                numbers.append(number)
-
-            # Add delay to avoid rate limiting
-            if i < count - 1:
-                time.sleep(delay)
-
-        return numbers
+        return self._run(
+            lambda client: self._agenerate_samples(
+                client,
+                asyncio.Semaphore(self.max_concurrent_requests),
+                min_val,
+                max_val,
+                count,
+                prompt_type,
+            )
+        )
 
     def run_consistency_test(
         self,
@@ -148,6 +770,7 @@ class NumberGenerator:
         samples_per_range: int = 100,
         runs: int = 5,
         prompt_type: str = "direct",
+        results_path: Optional[str] = None,
     ) -> Dict:
         """
         Run multiple tests to check consistency across different ranges and runs.
@@ -157,9 +780,15 @@ class NumberGenerator:
             samples_per_range (int): Number of samples to generate per range
             runs (int): Number of runs to perform
             prompt_type (str): Type of prompt to use
+            results_path (Optional[str]): JSONL file each batch is appended to
+                as soon as it completes (overwritten first); read it back with
+                load_streamed_data
 
         Returns:
             Dict: Results containing all generated numbers and statistics
+
+        Raises:
+            CacheMissError: In replay cache mode, if a sample is not cached
         """
         results = {
             "ranges": ranges,
@@ -170,25 +799,86 @@ class NumberGenerator:
             "statistics": {},
         }
 
-        for run in range(runs):
-            print(f"Running test {run + 1}/{runs}...")
-            run_data = {}
+        print(
+            f"Generating {samples_per_range} numbers for each of {len(ranges)} ranges "
+            f"over {runs} runs, {self.max_concurrent_requests} requests at a time..."
+        )
 
-            for min_val, max_val in ranges:
-                range_key = f"{min_val}-{max_val}"
-                print(
-                    f"  Generating {samples_per_range} numbers in range [{min_val}, {max_val}]..."
-                )
+        errors = {"retried": 0, "dropped": 0}
+
+        # Result keys, formatted once and shared by the stream and the results
+        range_keys = [f"{min_val}-{max_val}" for min_val, max_val in ranges]
+
+        # One bar over every sample, redrawn at most twice a second
+        progress = None
+        if tqdm is not None:
+            progress = tqdm(
+                total=runs * len(ranges) * samples_per_range,
+                desc="Generating",
+                unit="sample",
+                mininterval=0.5,
+            )
 
-                numbers = self.generate_batch(
-                    min_val, max_val, samples_per_range, prompt_type
+        async def generate_all(client: AsyncOpenAI, stream) -> List[List[float]]:
+            # One semaphore bounds every request of every run and range
+            semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+            async def generate_range(
+                run: int, min_val: float, max_val: float, range_key: str
+            ):
+                # The run number is the cache nonce, so a re-run of the same
+                # test replays the same samples
+                numbers = await self._agenerate_samples(
+                    client,
+                    semaphore,
+                    min_val,
+                    max_val,
+                    samples_per_range,
+                    prompt_type,
+                    f"run_{run + 1}",
+                    errors,
+                    progress,
                 )
-                run_data[range_key] = numbers
+                if stream is not None:
+                    record = {
+                        "run": run + 1,
+                        "range": range_key,
+                        "numbers": numbers,
+                    }
+                    stream.write(_dumps_line(record))
+                    stream.flush()
+                return numbers
+
+            batches = [
+                generate_range(run, min_val, max_val, range_key)
+                for run in range(runs)
+                for (min_val, max_val), range_key in zip(ranges, range_keys)
+            ]
+            return await asyncio.gather(*batches)
+
+        try:
+            if results_path is None:
+                batches = iter(self._run(lambda client: generate_all(client, None)))
+            else:
+                with open(results_path, "wb") as stream:
+                    batches = iter(
+                        self._run(lambda client: generate_all(client, stream))
+                    )
+        finally:
+            if progress is not None:
+                progress.close()
+
+        for run in range(runs):
+            run_data = {}
+
+            for range_key in range_keys:
+                run_data[range_key] = next(batches)
 
             results["data"][f"run_{run + 1}"] = run_data
 
         # Calculate statistics
         results["statistics"] = self._calculate_statistics(results["data"])
+        results["statistics"]["errors"] = errors
 
         return results
 
@@ -200,25 +890,31 @@ class NumberGenerator:
             data (Dict): The generated data
 
         Returns:
-            Dict: Statistical measures
+            Dict: Statistical measures per run and range, plus "total_count",
+                the number of samples across all runs and ranges
         """
         stats = {}
+        total_count = 0
 
         for run_key, run_data in data.items():
             stats[run_key] = {}
 
             for range_key, numbers in run_data.items():
+                total_count += len(numbers)
                 if numbers:
-                    numbers_array = np.array(numbers)
+                    numbers_array = np.asarray(numbers, dtype=np.float64)
+                    # One sort gives min, max and every quantile by lookup
+                    ordered = np.sort(numbers_array)
                     stats[run_key][range_key] = {
                         "count": len(numbers),
-                        "mean": float(np.mean(numbers_array)),
-                        "std": float(np.std(numbers_array)),
-                        "min": float(np.min(numbers_array)),
-                        "max": float(np.max(numbers_array)),
-                        "median": float(np.median(numbers_array)),
-                        "q25": float(np.percentile(numbers_array, 25)),
-                        "q75": float(np.percentile(numbers_array, 75)),
+                        "mean": float(numbers_array.mean()),
+                        "std": float(numbers_array.std()),
+                        "min": float(ordered[0]),
+                        "max": float(ordered[-1]),
+                        "median": _sorted_median(ordered),
+                        "q25": _sorted_quantile(ordered, 0.25),
+                        "q75": _sorted_quantile(ordered, 0.75),
                     }
 
+        stats["total_count"] = total_count
         return stats
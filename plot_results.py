@@ -5,13 +5,61 @@ This creates visualizations that help understand the model's prediction patterns
 """
 
 import os
+import sys
 import json
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Screen resolution; raise to 300 for print-quality output
+DPI = 150
+
+# Below this many figures, starting worker processes (each importing
+# matplotlib and seaborn) costs more than rendering them in this process
+MIN_PARALLEL_JOBS = 6
+
+# Per-process figures redrawn for every range, keyed by plot kind
+_RANGE_FIGURES: Dict[str, "Figure"] = {}
+
+
+def _pyplot():
+    """Import pyplot on first use, so loading results stays lightweight."""
+    import matplotlib
+
+    # Use the non-interactive backend on headless machines, unless one was
+    # chosen
+    if (
+        sys.platform.startswith("linux")
+        and not os.environ.get("DISPLAY")
+        and not os.environ.get("WAYLAND_DISPLAY")
+        and "MPLBACKEND" not in os.environ
+    ):
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _set_style():
+    """Apply the plotting style; also run in every worker process."""
+    import seaborn as sns
+
+    _pyplot().style.use("seaborn-v0_8")
+    sns.set_palette("husl")
+
+
+def _init_worker():
+    """Select Agg before pyplot loads; workers only ever save files."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    _set_style()
+
 
 def get_results_and_ranges(results: Dict):
     """Helper to extract data and ranges from possibly nested results dict."""
@@ -27,6 +75,26 @@ def get_results_and_ranges(results: Dict):
         raise KeyError("Could not find 'data' and 'ranges' in results file.")
 
 
+def _range_keys(ranges: List[Tuple[float, float]]) -> List[str]:
+    """Format the data key of every range, in the order of ranges."""
+    return [f"{min_val}-{max_val}" for min_val, max_val in ranges]
+
+
+def _collect(data: Dict, range_keys: List[str]) -> Dict[str, np.ndarray]:
+    """Gather every run's numbers for each range into one array per range."""
+    per_range = {}
+    for range_key in range_keys:
+        per_range[range_key] = np.fromiter(
+            (
+                number
+                for run_data in data.values()
+                for number in run_data.get(range_key, [])
+            ),
+            dtype=np.float64,
+        )
+    return per_range
+
+
 def create_distribution_plots(results: Dict, save_dir: str = "plots"):
     """
     Create and save distribution plots for the number generation results.
@@ -39,8 +107,7 @@ def create_distribution_plots(results: Dict, save_dir: str = "plots"):
     Path(save_dir).mkdir(exist_ok=True)
 
     # Set up plotting style
-    plt.style.use("seaborn-v0_8")
-    sns.set_palette("husl")
+    _set_style()
 
     # Use helper to extract data and ranges
     data, ranges = get_results_and_ranges(results)
@@ -48,100 +115,186 @@ def create_distribution_plots(results: Dict, save_dir: str = "plots"):
     print(f"📊 Creating distribution plots...")
     print(f"📁 Saving plots to: {save_dir}/")
 
-    # 1. Individual range distributions
-    create_individual_distributions(data, ranges, save_dir)
+    # Format each range's data key once and pool its numbers across runs
+    # for every plot
+    range_keys = _range_keys(ranges)
+    per_range = _collect(data, range_keys)
+
+    distribution_jobs = _distribution_jobs(ranges, range_keys, save_dir, per_range)
+    run_jobs = _run_comparison_jobs(data, ranges, range_keys, save_dir)
+
+    # The combined, bias and coverage figures are one job each
+    n_jobs = len(distribution_jobs) + len(run_jobs) + 3
+    max_workers = min(n_jobs, os.cpu_count() or 1)
+    if n_jobs < MIN_PARALLEL_JOBS or max_workers < 2:
+        for job in distribution_jobs:
+            print(f"  📈 Saved: {_plot_range_distribution(job)}")
+        create_combined_distribution(data, ranges, save_dir, per_range, range_keys)
+        for job in run_jobs:
+            print(f"  🔄 Saved: {_plot_range_runs(job)}")
+        create_bias_visualization(data, ranges, save_dir, per_range, range_keys)
+        create_coverage_analysis(data, ranges, save_dir, per_range, range_keys)
+        print(f"✅ All plots saved to {save_dir}/")
+        return
 
-    # 2. Combined distribution comparison
-    create_combined_distribution(data, ranges, save_dir)
+    # Every figure is independent, so they are rendered across processes;
+    # workers only receive arrays and rebuild their own figures
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker
+    ) as executor:
+        # 1. Individual range distributions
+        distributions = executor.map(_plot_range_distribution, distribution_jobs)
+
+        # 2. Combined distribution comparison
+        combined = executor.submit(
+            create_combined_distribution, data, ranges, save_dir, per_range, range_keys
+        )
 
-    # 3. Run-by-run comparison
-    create_run_comparison(data, ranges, save_dir)
+        # 3. Run-by-run comparison
+        run_comparisons = executor.map(_plot_range_runs, run_jobs)
 
-    # 4. Bias visualization
-    create_bias_visualization(data, ranges, save_dir)
+        # 4. Bias visualization
+        bias = executor.submit(
+            create_bias_visualization, data, ranges, save_dir, per_range, range_keys
+        )
 
-    # 5. Coverage analysis
-    create_coverage_analysis(data, ranges, save_dir)
+        # 5. Coverage analysis
+        coverage = executor.submit(
+            create_coverage_analysis, data, ranges, save_dir, per_range, range_keys
+        )
+
+        for filename in distributions:
+            print(f"  📈 Saved: {filename}")
+        for filename in run_comparisons:
+            print(f"  🔄 Saved: {filename}")
+        for future in (combined, bias, coverage):
+            future.result()
 
     print(f"✅ All plots saved to {save_dir}/")
 
 
+def _range_figure(name: str) -> Tuple["Figure", List]:
+    """
+    Return this process's reusable two-panel figure for name, axes cleared.
+
+    Figures are created outside pyplot so they are never registered with
+    the figure manager and can be redrawn for every range.
+    """
+    fig = _RANGE_FIGURES.get(name)
+    if fig is None:
+        from matplotlib.figure import Figure
+
+        _pyplot()
+        fig = Figure(figsize=(15, 6), layout="constrained")
+        fig.subplots(1, 2)
+        _RANGE_FIGURES[name] = fig
+
+    for ax in fig.axes:
+        ax.clear()
+
+    return fig, fig.axes
+
+
+def _plot_range_distribution(job: Tuple) -> str:
+    """
+    Save the histogram and box plot of one range's pooled numbers.
+
+    Args:
+        job (Tuple): (min_val, max_val, range_key, all_numbers, save_dir)
+
+    Returns:
+        str: File name of the saved plot
+    """
+    min_val, max_val, range_key, all_numbers, save_dir = job
+    fig, (ax1, ax2) = _range_figure("distribution")
+    mean = all_numbers.mean()
+    expected_mean = (min_val + max_val) / 2
+
+    # Histogram
+    ax1.hist(all_numbers, bins=20, alpha=0.7, color="skyblue", edgecolor="black")
+    ax1.axvline(
+        mean,
+        color="red",
+        linestyle="--",
+        label=f"Mean: {mean:.3f}",
+    )
+    ax1.axvline(
+        expected_mean,
+        color="green",
+        linestyle="--",
+        label=f"Expected: {expected_mean:.3f}",
+    )
+    ax1.set_xlabel("Generated Numbers")
+    ax1.set_ylabel("Frequency")
+    ax1.set_title(f"Distribution for Range [{min_val}, {max_val}]")
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # Box plot
+    ax2.boxplot(all_numbers, vert=True)
+    ax2.set_ylabel("Generated Numbers")
+    ax2.set_title(f"Box Plot for Range [{min_val}, {max_val}]")
+    ax2.grid(True, alpha=0.3)
+
+    filename = f"distribution_{range_key.replace('.', '_')}.png"
+    fig.savefig(f"{save_dir}/{filename}", dpi=DPI, bbox_inches="tight")
+    return filename
+
+
+def _distribution_jobs(
+    ranges: List[Tuple[float, float]],
+    range_keys: List[str],
+    save_dir: str,
+    per_range: Dict[str, np.ndarray],
+) -> List[Tuple]:
+    """Build a _plot_range_distribution job for every range with data."""
+    jobs = []
+    for (min_val, max_val), range_key in zip(ranges, range_keys):
+        numbers = per_range[range_key]
+        if numbers.size:
+            jobs.append((min_val, max_val, range_key, numbers, save_dir))
+    return jobs
+
+
 def create_individual_distributions(
-    data: Dict, ranges: List[Tuple[float, float]], save_dir: str
+    data: Dict,
+    ranges: List[Tuple[float, float]],
+    save_dir: str,
+    per_range: Optional[Dict[str, np.ndarray]] = None,
 ):
     """Create individual distribution plots for each range."""
+    range_keys = _range_keys(ranges)
+    if per_range is None:
+        per_range = _collect(data, range_keys)
 
-    for min_val, max_val in ranges:
-        range_key = f"{min_val}-{max_val}"
-        all_numbers = []
-
-        # Collect all numbers for this range across all runs
-        for run_key, run_data in data.items():
-            if range_key in run_data:
-                all_numbers.extend(run_data[range_key])
-
-        if all_numbers:
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-
-            # Histogram
-            ax1.hist(
-                all_numbers, bins=20, alpha=0.7, color="skyblue", edgecolor="black"
-            )
-            ax1.axvline(
-                np.mean(all_numbers),
-                color="red",
-                linestyle="--",
-                label=f"Mean: {np.mean(all_numbers):.3f}",
-            )
-            ax1.axvline(
-                (min_val + max_val) / 2,
-                color="green",
-                linestyle="--",
-                label=f"Expected: {(min_val + max_val) / 2:.3f}",
-            )
-            ax1.set_xlabel("Generated Numbers")
-            ax1.set_ylabel("Frequency")
-            ax1.set_title(f"Distribution for Range [{min_val}, {max_val}]")
-            ax1.legend()
-            ax1.grid(True, alpha=0.3)
-
-            # Box plot
-            ax2.boxplot(all_numbers, vert=True)
-            ax2.set_ylabel("Generated Numbers")
-            ax2.set_title(f"Box Plot for Range [{min_val}, {max_val}]")
-            ax2.grid(True, alpha=0.3)
-
-            plt.tight_layout()
-            plt.savefig(
-                f"{save_dir}/distribution_{range_key.replace('.', '_')}.png",
-                dpi=300,
-                bbox_inches="tight",
-            )
-            plt.close()
-
-            print(f"  📈 Saved: distribution_{range_key.replace('.', '_')}.png")
+    for job in _distribution_jobs(ranges, range_keys, save_dir, per_range):
+        print(f"  📈 Saved: {_plot_range_distribution(job)}")
 
 
 def create_combined_distribution(
-    data: Dict, ranges: List[Tuple[float, float]], save_dir: str
+    data: Dict,
+    ranges: List[Tuple[float, float]],
+    save_dir: str,
+    per_range: Optional[Dict[str, np.ndarray]] = None,
+    range_keys: Optional[List[str]] = None,
 ):
     """Create a combined distribution plot comparing all ranges."""
+    if range_keys is None:
+        range_keys = _range_keys(ranges)
+    if per_range is None:
+        per_range = _collect(data, range_keys)
 
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    plt = _pyplot()
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10), layout="constrained")
 
     # Collect all data
     all_data = []
     labels = []
 
-    for min_val, max_val in ranges:
-        range_key = f"{min_val}-{max_val}"
-        numbers = []
-
-        for run_key, run_data in data.items():
-            if range_key in run_data:
-                numbers.extend(run_data[range_key])
+    for (min_val, max_val), range_key in zip(ranges, range_keys):
+        numbers = per_range[range_key]
 
-        if numbers:
+        if numbers.size:
             all_data.append(numbers)
             labels.append(f"[{min_val}, {max_val}]")
 
@@ -161,19 +314,69 @@ def create_combined_distribution(
     ax2.set_title("Box Plot Comparison Across All Ranges")
     ax2.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig(f"{save_dir}/combined_distributions.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(f"{save_dir}/combined_distributions.png", dpi=DPI, bbox_inches="tight")
+    plt.close(fig)
 
     print(f"  📊 Saved: combined_distributions.png")
 
 
-def create_run_comparison(data: Dict, ranges: List[Tuple[float, float]], save_dir: str):
-    """Create plots comparing results across different runs."""
+def _plot_range_runs(job: Tuple) -> str:
+    """
+    Save the per-run box plots and mean comparison of one range.
+
+    Args:
+        job (Tuple): (min_val, max_val, range_key, run_data, run_labels, save_dir)
+
+    Returns:
+        str: File name of the saved plot
+    """
+    min_val, max_val, range_key, run_data, run_labels, save_dir = job
+    fig, (ax1, ax2) = _range_figure("run_comparison")
+
+    # Box plots by run
+    ax1.boxplot(run_data, labels=run_labels)
+    ax1.set_ylabel("Generated Numbers")
+    ax1.set_title(f"Consistency Across Runs: [{min_val}, {max_val}]")
+    ax1.grid(True, alpha=0.3)
+
+    # Mean comparison
+    means = [np.mean(numbers) for numbers in run_data]
+    expected_mean = (min_val + max_val) / 2
 
-    for min_val, max_val in ranges:
-        range_key = f"{min_val}-{max_val}"
+    bars = ax2.bar(run_labels, means, alpha=0.7)
+    ax2.axhline(
+        y=expected_mean,
+        color="red",
+        linestyle="--",
+        label=f"Expected: {expected_mean:.3f}",
+    )
+    ax2.set_ylabel("Mean Value")
+    ax2.set_title(f"Mean Values by Run: [{min_val}, {max_val}]")
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
 
+    # Color bars based on bias
+    for bar, mean in zip(bars, means):
+        if mean > expected_mean:
+            bar.set_color("red")
+        else:
+            bar.set_color("blue")
+
+    filename = f"run_comparison_{range_key.replace('.', '_')}.png"
+    fig.savefig(f"{save_dir}/{filename}", dpi=DPI, bbox_inches="tight")
+    return filename
+
+
+def _run_comparison_jobs(
+    data: Dict,
+    ranges: List[Tuple[float, float]],
+    range_keys: List[str],
+    save_dir: str,
+) -> List[Tuple]:
+    """Build a _plot_range_runs job for every range with at least two runs."""
+    jobs = []
+
+    for (min_val, max_val), range_key in zip(ranges, range_keys):
         # Collect data by run
         run_data = []
         run_labels = []
@@ -184,74 +387,45 @@ def create_run_comparison(data: Dict, ranges: List[Tuple[float, float]], save_di
                 run_labels.append(run_key.replace("_", " ").title())
 
         if len(run_data) > 1:
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+            jobs.append((min_val, max_val, range_key, run_data, run_labels, save_dir))
 
-            # Box plots by run
-            ax1.boxplot(run_data, labels=run_labels)
-            ax1.set_ylabel("Generated Numbers")
-            ax1.set_title(f"Consistency Across Runs: [{min_val}, {max_val}]")
-            ax1.grid(True, alpha=0.3)
+    return jobs
 
-            # Mean comparison
-            means = [np.mean(numbers) for numbers in run_data]
-            expected_mean = (min_val + max_val) / 2
 
-            bars = ax2.bar(run_labels, means, alpha=0.7)
-            ax2.axhline(
-                y=expected_mean,
-                color="red",
-                linestyle="--",
-                label=f"Expected: {expected_mean:.3f}",
-            )
-            ax2.set_ylabel("Mean Value")
-            ax2.set_title(f"Mean Values by Run: [{min_val}, {max_val}]")
-            ax2.legend()
-            ax2.grid(True, alpha=0.3)
-
-            # Color bars based on bias
-            for bar, mean in zip(bars, means):
-                if mean > expected_mean:
-                    bar.set_color("red")
-                else:
-                    bar.set_color("blue")
-
-            plt.tight_layout()
-            plt.savefig(
-                f"{save_dir}/run_comparison_{range_key.replace('.', '_')}.png",
-                dpi=300,
-                bbox_inches="tight",
-            )
-            plt.close()
-
-            print(f"  🔄 Saved: run_comparison_{range_key.replace('.', '_')}.png")
+def create_run_comparison(data: Dict, ranges: List[Tuple[float, float]], save_dir: str):
+    """Create plots comparing results across different runs."""
+    for job in _run_comparison_jobs(data, ranges, _range_keys(ranges), save_dir):
+        print(f"  🔄 Saved: {_plot_range_runs(job)}")
 
 
 def create_bias_visualization(
-    data: Dict, ranges: List[Tuple[float, float]], save_dir: str
+    data: Dict,
+    ranges: List[Tuple[float, float]],
+    save_dir: str,
+    per_range: Optional[Dict[str, np.ndarray]] = None,
+    range_keys: Optional[List[str]] = None,
 ):
     """Create bias analysis visualization."""
+    if range_keys is None:
+        range_keys = _range_keys(ranges)
+    if per_range is None:
+        per_range = _collect(data, range_keys)
 
     biases = []
     range_labels = []
     coverages = []
 
-    for min_val, max_val in ranges:
-        range_key = f"{min_val}-{max_val}"
-        all_numbers = []
-
-        for run_key, run_data in data.items():
-            if range_key in run_data:
-                all_numbers.extend(run_data[range_key])
+    for (min_val, max_val), range_key in zip(ranges, range_keys):
+        numbers_array = per_range[range_key]
 
-        if all_numbers:
-            numbers_array = np.array(all_numbers)
+        if numbers_array.size:
             expected_mean = (min_val + max_val) / 2
-            actual_mean = np.mean(numbers_array)
+            actual_mean = numbers_array.mean()
             bias = actual_mean - expected_mean
 
             # Calculate coverage
             range_width = max_val - min_val
-            actual_range = np.max(numbers_array) - np.min(numbers_array)
+            actual_range = np.ptp(numbers_array)
             coverage = actual_range / range_width
 
             biases.append(bias)
@@ -259,7 +433,10 @@ def create_bias_visualization(
             range_labels.append(f"[{min_val}, {max_val}]")
 
     # Create bias visualization
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+    plt = _pyplot()
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(
+        2, 2, figsize=(16, 12), layout="constrained"
+    )
 
     # Bias bar chart
     bars1 = ax1.bar(
@@ -320,45 +497,68 @@ def create_bias_visualization(
         bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgray", alpha=0.5),
     )
 
-    plt.tight_layout()
-    plt.savefig(f"{save_dir}/bias_analysis.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(f"{save_dir}/bias_analysis.png", dpi=DPI, bbox_inches="tight")
+    plt.close(fig)
 
     print(f"  📊 Saved: bias_analysis.png")
 
 
 def create_coverage_analysis(
-    data: Dict, ranges: List[Tuple[float, float]], save_dir: str
+    data: Dict,
+    ranges: List[Tuple[float, float]],
+    save_dir: str,
+    per_range: Optional[Dict[str, np.ndarray]] = None,
+    range_keys: Optional[List[str]] = None,
 ):
     """Create detailed coverage analysis."""
+    if range_keys is None:
+        range_keys = _range_keys(ranges)
+    if per_range is None:
+        per_range = _collect(data, range_keys)
+
+    from matplotlib.colors import to_rgba_array
+
+    plt = _pyplot()
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6), layout="constrained")
+
+    # Plot 1: Number distribution with range boundaries, one point per
+    # sample in a single scatter, colored by range
+    plotted = []
+    plotted_keys = []
+    for (min_val, max_val), range_key in zip(ranges, range_keys):
+        if per_range[range_key].size:
+            plotted.append((min_val, max_val))
+            plotted_keys.append(range_key)
+
+    if plotted:
+        x_idx = np.repeat(
+            np.arange(len(plotted_keys)), [per_range[key].size for key in plotted_keys]
+        )
+        y_all = np.concatenate([per_range[key] for key in plotted_keys])
+        cycle = to_rgba_array(plt.rcParams["axes.prop_cycle"].by_key()["color"])
+        colors = cycle[np.arange(len(plotted_keys)) % len(cycle)]
+
+        ax1.scatter(x_idx, y_all, c=colors[x_idx], alpha=0.6, s=20)
+
+        # Boundaries and midpoints span the full width, drawn as one
+        # collection each
+        bounds = np.array(plotted, dtype=np.float64)
+        to_axes = ax1.get_yaxis_transform()
+        ax1.hlines(
+            bounds.ravel(),
+            0,
+            1,
+            transform=to_axes,
+            colors="red",
+            linestyles="--",
+            alpha=0.7,
+        )
+        ax1.hlines(
+            bounds.mean(axis=1), 0, 1, transform=to_axes, colors="green", alpha=0.5
+        )
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
-
-    for min_val, max_val in ranges:
-        range_key = f"{min_val}-{max_val}"
-        all_numbers = []
-
-        for run_key, run_data in data.items():
-            if range_key in run_data:
-                all_numbers.extend(run_data[range_key])
-
-        if all_numbers:
-            numbers_array = np.array(all_numbers)
-
-            # Plot 1: Number distribution with range boundaries
-            ax1.scatter(
-                [range_key] * len(numbers_array),
-                numbers_array,
-                alpha=0.6,
-                s=20,
-                label=f"[{min_val}, {max_val}]",
-            )
-            ax1.axhline(y=min_val, color="red", linestyle="--", alpha=0.7)
-            ax1.axhline(y=max_val, color="red", linestyle="--", alpha=0.7)
-            ax1.axhline(
-                y=(min_val + max_val) / 2, color="green", linestyle="-", alpha=0.5
-            )
-
+    ax1.set_xticks(np.arange(len(plotted_keys)))
+    ax1.set_xticklabels(plotted_keys)
     ax1.set_ylabel("Generated Numbers")
     ax1.set_title("Number Distribution vs Range Boundaries")
     ax1.tick_params(axis="x", rotation=45)
@@ -368,18 +568,12 @@ def create_coverage_analysis(
     coverage_data = []
     range_names = []
 
-    for min_val, max_val in ranges:
-        range_key = f"{min_val}-{max_val}"
-        all_numbers = []
-
-        for run_key, run_data in data.items():
-            if range_key in run_data:
-                all_numbers.extend(run_data[range_key])
+    for (min_val, max_val), range_key in zip(ranges, range_keys):
+        numbers_array = per_range[range_key]
 
-        if all_numbers:
-            numbers_array = np.array(all_numbers)
+        if numbers_array.size:
             range_width = max_val - min_val
-            actual_range = np.max(numbers_array) - np.min(numbers_array)
+            actual_range = np.ptp(numbers_array)
             coverage = actual_range / range_width
 
             coverage_data.append(coverage)
@@ -405,9 +599,8 @@ def create_coverage_analysis(
 
     plt.colorbar(im, ax=ax2, label="Coverage Ratio")
 
-    plt.tight_layout()
-    plt.savefig(f"{save_dir}/coverage_analysis.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(f"{save_dir}/coverage_analysis.png", dpi=DPI, bbox_inches="tight")
+    plt.close(fig)
 
     print(f"  📈 Saved: coverage_analysis.png")
 
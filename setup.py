@@ -5,7 +5,6 @@ This script runs when the Pixi environment is activated.
 """
 
 import os
-import shutil
 
 
 def setup_environment():
@@ -15,7 +14,11 @@ def setup_environment():
     # Create .env file if it doesn't exist
     if not os.path.exists(".env"):
         if os.path.exists("env_example.txt"):
-            shutil.copy("env_example.txt", ".env")
+            # Only needed on first activation, so imported here
+            from pathlib import Path
+
+            # A plain read and write, the template's metadata is not needed
+            Path(".env").write_bytes(Path("env_example.txt").read_bytes())
             print("✅ Created .env file from env_example.txt")
         else:
             print("⚠️  env_example.txt not found. Please create .env file manually.")
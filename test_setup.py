@@ -2,167 +2,402 @@
 """
 Test script to verify the setup and basic functionality.
 This script tests the imports and basic functionality without making API calls.
+Set SETUP_TEST_FAST=1 to stop at the first failing test.
 """
 
+import ast
+import io
+import importlib.machinery
+import importlib.util
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from types import MappingProxyType
+from typing import Callable, Tuple
+
+# (module, class) checked by test_local_modules
+LOCAL_CLASSES = (
+    ("number_generator", "NumberGenerator"),
+    ("number_cache", "ResponseCache"),
+    ("analyzer", "NumberAnalyzer"),
+)
+
+# Per-thread report sink, set by _run_captured so concurrent tests don't interleave
+_capture = threading.local()
+
+# Held while stdout is redirected by _quiet, so main's report writes wait
+_stdout_lock = threading.Lock()
+
+# Mock data for test_analyzer_functionality, read-only so it can be shared
+_MOCK_RESULTS = MappingProxyType(
+    {
+        "ranges": ((0.0, 1.0), (1.0, 10.0)),
+        "samples_per_range": 50,
+        "runs": 2,
+        "prompt_type": "direct",
+        "data": MappingProxyType(
+            {
+                "run_1": MappingProxyType(
+                    {
+                        "0.0-1.0": (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9),
+                        "1.0-10.0": (1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5),
+                    }
+                ),
+                "run_2": MappingProxyType(
+                    {
+                        "0.0-1.0": (
+                            0.15,
+                            0.25,
+                            0.35,
+                            0.45,
+                            0.55,
+                            0.65,
+                            0.75,
+                            0.85,
+                            0.95,
+                        ),
+                        "1.0-10.0": (1.2, 2.2, 3.2, 4.2, 5.2, 6.2, 7.2, 8.2, 9.2),
+                    }
+                ),
+            }
+        ),
+    }
+)
+
+# (module, package) probed by test_imports
+REQUIRED_MODULES = (
+    ("numpy", "numpy"),
+    ("pandas", "pandas"),
+    ("matplotlib.pyplot", "matplotlib"),
+    ("seaborn", "seaborn"),
+    ("openai", "openai"),
+    ("httpx", "httpx"),
+    ("dotenv", "python-dotenv"),
+    ("scipy.stats", "scipy"),
+)
+
+
+def _find_module(name: str) -> bool:
+    """
+    Check that a module is installed without executing any module body.
+
+    Submodules are searched for in their parent's package path, since
+    find_spec on a dotted name would import the parent first.
+
+    Args:
+        name (str): Dotted module name
+
+    Returns:
+        bool: True if the module can be found
+    """
+    parent, _, child = name.partition(".")
+    spec = importlib.util.find_spec(parent)
+    if spec is None or not child:
+        return spec is not None
+
+    if spec.submodule_search_locations is None:
+        return False
+    return (
+        importlib.machinery.PathFinder.find_spec(name, spec.submodule_search_locations)
+        is not None
+    )
 
 
-def test_imports():
-    """Test if all required modules can be imported."""
-    print("🔍 Testing imports...")
+@contextmanager
+def _report():
+    """
+    Collect a test's report lines and write them to stdout in one call.
 
+    Yields:
+        List[str]: Lines to print, without trailing newlines
+    """
+    out = []
     try:
-        import numpy as np
-
-        print("✅ numpy imported successfully")
-    except ImportError as e:
-        print(f"❌ numpy import failed: {e}")
-        return False
-
+        yield out
+    finally:
+        # Written even if the test raises, so its partial report is kept
+        if out:
+            text = "\n".join(out) + "\n"
+            sink = getattr(_capture, "sink", None)
+            if sink is not None:
+                sink.append(text)
+            else:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+
+
+@contextmanager
+def _quiet():
+    """
+    Discard what the code under test prints, such as expected warnings.
+    """
+    with _stdout_lock, redirect_stdout(io.StringIO()):
+        yield
+
+
+def _run_captured(test: Callable[[], bool]) -> Tuple[bool, str]:
+    """
+    Run a test with its report captured instead of printed.
+
+    Args:
+        test (Callable[[], bool]): One of the test_* functions
+
+    Returns:
+        Tuple[bool, str]: Whether the test passed, and its report
+    """
+    _capture.sink = []
     try:
-        import pandas as pd
+        ok = test()
+    finally:
+        text = "".join(_capture.sink)
+        _capture.sink = None
+    return ok, text
 
-        print("✅ pandas imported successfully")
-    except ImportError as e:
-        print(f"❌ pandas import failed: {e}")
-        return False
 
-    try:
-        import matplotlib.pyplot as plt
+def test_imports():
+    """Test if all required modules are installed."""
+    with _report() as out:
+        out.append("\n🔍 Testing imports...")
 
-        print("✅ matplotlib imported successfully")
-    except ImportError as e:
-        print(f"❌ matplotlib import failed: {e}")
-        return False
+        failures = []
+        for module, package in REQUIRED_MODULES:
+            if _find_module(module):
+                out.append(f"✅ {package} found")
+            else:
+                failures.append(package)
 
-    try:
-        import seaborn as sns
+        out.extend(f"❌ {package} not found" for package in failures)
 
-        print("✅ seaborn imported successfully")
-    except ImportError as e:
-        print(f"❌ seaborn import failed: {e}")
-        return False
+        return not failures
 
-    try:
-        import openai
 
-        print("✅ openai imported successfully")
-    except ImportError as e:
-        print(f"❌ openai import failed: {e}")
-        return False
+def _defines_class(module: str, class_name: str) -> bool:
+    """
+    Check that a module defines a class, by parsing rather than importing it.
 
-    try:
-        from dotenv import load_dotenv
+    Args:
+        module (str): Module name
+        class_name (str): Name of the class expected at module level
 
-        print("✅ python-dotenv imported successfully")
-    except ImportError as e:
-        print(f"❌ python-dotenv import failed: {e}")
+    Returns:
+        bool: True if the module's source has a top-level class of that name
+    """
+    spec = importlib.util.find_spec(module)
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
         return False
 
     try:
-        from scipy import stats
-
-        print("✅ scipy imported successfully")
-    except ImportError as e:
-        print(f"❌ scipy import failed: {e}")
+        with open(spec.origin, "rb") as f:
+            tree = ast.parse(f.read(), filename=spec.origin)
+    except (OSError, SyntaxError):
         return False
 
-    return True
+    return any(
+        isinstance(node, ast.ClassDef) and node.name == class_name for node in tree.body
+    )
 
 
 def test_local_modules():
-    """Test if our local modules can be imported."""
-    print("\n🔍 Testing local modules...")
+    """Test if our local modules define their main classes."""
+    with _report() as out:
+        out.append("\n🔍 Testing local modules...")
 
-    try:
-        from number_generator import NumberGenerator
+        for module, class_name in LOCAL_CLASSES:
+            if _defines_class(module, class_name):
+                out.append(f"✅ {class_name} found in {module}.py")
+            else:
+                out.append(f"❌ {class_name} not found in {module}.py")
+                return False
 
-        print("✅ NumberGenerator imported successfully")
-    except ImportError as e:
-        print(f"❌ NumberGenerator import failed: {e}")
-        return False
+        return True
 
-    try:
-        from analyzer import NumberAnalyzer
 
-        print("✅ NumberAnalyzer imported successfully")
-    except ImportError as e:
-        print(f"❌ NumberAnalyzer import failed: {e}")
-        return False
+def test_analyzer_functionality():
+    """Test basic analyzer functionality with mock data."""
+    with _report() as out:
+        out.append("\n🔍 Testing analyzer functionality...")
 
-    return True
+        try:
+            from analyzer import NumberAnalyzer
+            import numpy as np
 
+            analyzer = NumberAnalyzer()
+            analysis = analyzer.analyze_distribution(_MOCK_RESULTS)
 
-def test_analyzer_functionality():
-    """Test basic analyzer functionality with mock data."""
-    print("\n🔍 Testing analyzer functionality...")
+            out.append("✅ Analyzer functionality test passed")
+            out.append(f"   - Analyzed {len(analysis['range_analysis'])} ranges")
+            out.append(f"   - Bias analysis completed")
+            out.append(f"   - Consistency analysis completed")
 
-    try:
-        from analyzer import NumberAnalyzer
-        import numpy as np
-
-        # Create mock data
-        mock_results = {
-            "ranges": [(0.0, 1.0), (1.0, 10.0)],
-            "samples_per_range": 50,
-            "runs": 2,
-            "prompt_type": "direct",
-            "data": {
-                "run_1": {
-                    "0.0-1.0": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9],
-                    "1.0-10.0": [1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5],
-                },
-                "run_2": {
-                    "0.0-1.0": [0.15, 0.25, 0.35, 0.45, 0.55, 0.65, 0.75, 0.85, 0.95],
-                    "1.0-10.0": [1.2, 2.2, 3.2, 4.2, 5.2, 6.2, 7.2, 8.2, 9.2],
-                },
-            },
-        }
-
-        analyzer = NumberAnalyzer()
-        analysis = analyzer.analyze_distribution(mock_results)
-
-        print("✅ Analyzer functionality test passed")
-        print(f"   - Analyzed {len(analysis['range_analysis'])} ranges")
-        print(f"   - Bias analysis completed")
-        print(f"   - Consistency analysis completed")
+            return True
 
-        return True
+        except Exception as e:
+            out.append(f"❌ Analyzer functionality test failed: {e}")
+            return False
 
-    except Exception as e:
-        print(f"❌ Analyzer functionality test failed: {e}")
-        return False
+
+def test_generator_functionality():
+    """Test the generator's parsing, caching and streaming without API calls."""
+    with _report() as out:
+        out.append("\n🔍 Testing generator functionality...")
+
+        try:
+            import asyncio
+            import tempfile
+            from unittest import mock
+            import numpy as np
+            import number_generator
+            from number_cache import CacheMissError, ResponseCache
+            from number_generator import (
+                AsyncRateLimiter,
+                NumberGenerator,
+                _dumps_line,
+                _filter_inrange,
+                load_streamed_data,
+            )
+
+            checks = {}
+
+            # A range, thousands separators and an exponent; the warnings
+            # for the rejected responses are expected
+            with _quiet():
+                numbers = NumberGenerator._parse_and_filter_batch(
+                    ["0.5", "1-10", "1,000", "-1.2e-3"], -1, 1
+                )
+            checks["Response parsing"] = numbers == [0.5, -0.0012]
+
+            kept, rejected = _filter_inrange(np.array([0.5, 2.0, np.nan]), 0, 1)
+            checks["Range filter"] = kept.tolist() == [0.5] and rejected.size == 2
+
+            with tempfile.TemporaryDirectory() as tmp:
+                cache_path = os.path.join(tmp, "cache.sqlite")
+                key, other_key = (
+                    ResponseCache.make_key("model", "url", "prompt", 0.7, 8, nonce)
+                    for nonce in ("0", "1")
+                )
+                cache = ResponseCache(cache_path)
+                cache.put(key, "0.5")
+                cache.close()
+
+                replay = ResponseCache(cache_path, "replay")
+                try:
+                    replay.get(other_key)
+                    missed = False
+                except CacheMissError:
+                    missed = True
+                checks["Response cache"] = replay.get(key) == "0.5" and missed
+                replay.close()
+
+                # Batches are streamed in completion order, not run order
+                stream_path = os.path.join(tmp, "stream.jsonl")
+                with open(stream_path, "wb") as f:
+                    f.write(_dumps_line({"run": 2, "range": "0-1", "numbers": [0.2]}))
+                    f.write(_dumps_line({"run": 1, "range": "0-1", "numbers": [0.1]}))
+                checks["Streamed results"] = load_streamed_data(stream_path) == {
+                    "run_1": {"0-1": [0.1]},
+                    "run_2": {"0-1": [0.2]},
+                }
+
+                # Record a run with one empty response, then replay it from
+                # the cache alone; the empty sample is dropped both times
+                async def recorded(client, messages, temperature, max_tokens, extra):
+                    return ["0.5", None, "0.25"][: extra.get("n", 1)]
+
+                async def offline(client, messages, temperature, max_tokens, extra):
+                    raise AssertionError("replay sent a request")
+
+                replay_path = os.path.join(tmp, "replay.sqlite")
+                runs = {}
+                with _quiet(), mock.patch.dict(
+                    os.environ, {"OPENAI_API_KEY": "offline"}
+                ), mock.patch.object(number_generator, "tqdm", None):
+                    for mode, acreate in (("enabled", recorded), ("replay", offline)):
+                        generator = NumberGenerator(
+                            cache_mode=mode, cache_path=replay_path
+                        )
+                        generator._acreate = acreate
+                        runs[mode] = generator.run_consistency_test(
+                            [(0, 1)], samples_per_range=3, runs=1
+                        )["data"]
+                        generator.close()
+                checks["Cache replay"] = (
+                    runs["enabled"] == runs["replay"] == {"run_1": {"0-1": [0.5, 0.25]}}
+                )
+
+            # With the limiter's clock stopped and its sleeps recorded, the
+            # full bucket drains without waiting and the next request waits
+            # exactly one refill interval; no wall-clock timing is involved
+            limiter = AsyncRateLimiter(rpm=600, tpm=10**6)
+            clock = mock.Mock(monotonic=mock.Mock(return_value=limiter.last_update))
+            waits = []
+
+            async def record_sleep(delay):
+                waits.append(delay)
+
+            async def drain():
+                for _ in range(600):
+                    await limiter.acquire(1)
+                drained = limiter.request_tokens == 0 and not waits
+                await limiter.acquire(1)
+                return drained
+
+            with mock.patch.object(number_generator, "time", clock), mock.patch.object(
+                number_generator.asyncio, "sleep", record_sleep
+            ):
+                drained = asyncio.run(drain())
+            checks["Rate limiter"] = drained and waits == [0.1]
+
+            failed = [name for name, ok in checks.items() if not ok]
+            if failed:
+                out.append(f"❌ Generator checks failed: {', '.join(failed)}")
+                return False
+
+            out.append("✅ Generator functionality test passed")
+            for name in checks:
+                out.append(f"   - {name} checked")
+
+            return True
+
+        except Exception as e:
+            out.append(f"❌ Generator functionality test failed: {e}")
+            return False
 
 
 def test_environment():
     """Test environment setup."""
-    print("\n🔍 Testing environment...")
+    with _report() as out:
+        out.append("🔍 Testing environment...")
 
-    # Check if .env file exists
-    if os.path.exists(".env"):
-        print("✅ .env file found")
-    else:
-        print("⚠️  .env file not found (you'll need to create one)")
-        print("   Copy env_example.txt to .env and add your OpenAI API key")
-
-    # Check if required files exist
-    required_files = [
-        "number_generator.py",
-        "analyzer.py",
-        "main.py",
-        "requirements.txt",
-        "README.md",
-    ]
+        # One directory listing answers every existence check below
+        with os.scandir(".") as it:
+            entries = {entry.name for entry in it}
 
-    for file in required_files:
-        if os.path.exists(file):
-            print(f"✅ {file} found")
+        # Check if .env file exists
+        if ".env" in entries:
+            out.append("✅ .env file found")
         else:
-            print(f"❌ {file} missing")
-            return False
+            out.append("⚠️  .env file not found (you'll need to create one)")
+            out.append("   Copy env_example.txt to .env and add your OpenAI API key")
+
+        # Check if required files exist
+        required_files = [
+            "number_generator.py",
+            "analyzer.py",
+            "main.py",
+            "requirements.txt",
+            "README.md",
+        ]
+
+        for file in required_files:
+            if file in entries:
+                out.append(f"✅ {file} found")
+            else:
+                out.append(f"❌ {file} missing")
+                return False
 
-    return True
+        return True
 
 
 def main():
@@ -170,20 +405,44 @@ def main():
     print("🧪 Setup Test Suite")
     print("=" * 40)
 
+    # Cheapest and most foundational first: each test assumes the ones
+    # before it pass, so in fail-fast mode (run sequentially) the expensive
+    # imports are skipped once the environment is known to be broken
     tests = [
+        test_environment,
         test_imports,
         test_local_modules,
         test_analyzer_functionality,
-        test_environment,
+        test_generator_functionality,
     ]
+    fail_fast = os.environ.get("SETUP_TEST_FAST", "") not in ("", "0")
 
     passed = 0
     total = len(tests)
 
-    for test in tests:
-        if test():
-            passed += 1
-        print()
+    if fail_fast:
+        for test in tests:
+            ok = test()
+            if ok:
+                passed += 1
+            print()
+
+            if not ok:
+                print("⏭️  Skipped the remaining tests (SETUP_TEST_FAST is set)")
+                break
+    else:
+        # The tests are independent and mostly wait on imports and the
+        # filesystem, so run them together and print the reports in order
+        with ThreadPoolExecutor(max_workers=total) as executor:
+            futures = [executor.submit(_run_captured, test) for test in tests]
+
+            for future in futures:
+                ok, report = future.result()
+                with _stdout_lock:
+                    sys.stdout.write(report)
+                    print()
+                if ok:
+                    passed += 1
 
     print("=" * 40)
     print(f"📊 Test Results: {passed}/{total} tests passed")